@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -20,11 +20,43 @@ class ProviderCapabilities(BaseModel):
     default_params: dict = Field(
         default_factory=dict, description="Default extra params sent to provider API"
     )
+    supports_negative_prompt: bool = Field(
+        default=False, description="Whether the provider accepts a separate negative prompt"
+    )
+    max_prompt_chars: int | None = Field(
+        default=None, ge=1, description="Hard limit on prompt length in characters, if any"
+    )
     file_extension: str = Field(
         default="png", description="Image file extension produced by this provider"
     )
 
 
+class PreflightIssue(BaseModel):
+    code: str = Field(description="Machine-readable issue code, e.g. 'unsupported_size'")
+    field: str = Field(description="Request field the issue refers to, e.g. 'image_params.size'")
+    message: str = Field(description="Human-readable issue description")
+
+
+class PreflightResult(BaseModel):
+    prompt_text: str = Field(description="Normalized prompt text, FLEX markers preserved")
+    negative_prompt: str | None = Field(
+        default=None, description="Negative prompt, or None if dropped or not provided"
+    )
+    image_params: dict[str, Any] = Field(
+        default_factory=dict, description="Normalized provider-specific generation parameters"
+    )
+    errors: list[PreflightIssue] = Field(
+        default_factory=list, description="Problems that block the provider call"
+    )
+    warnings: list[PreflightIssue] = Field(
+        default_factory=list, description="Adjustments applied to the request during normalization"
+    )
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
 class Iteration(BaseModel):
     index: int = Field(description="Zero-based iteration index")
     prompt_text: str = Field(description="Image prompt used in this iteration")
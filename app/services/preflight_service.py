@@ -0,0 +1,207 @@
+from typing import Any
+
+from app.models.domain_models import PreflightIssue, PreflightResult, ProviderCapabilities
+from app.tools.log_tool import get_logger
+from app.utils.flex_utils import (
+    drop_last_clause,
+    parse_flex_blocks,
+    remove_flex_block,
+    replace_flex_block,
+    strip_flex_markers,
+)
+
+logger = get_logger(__name__)
+
+# Lowest priority first: these blocks are shortened, then dropped, before anything else.
+# Within a block state (see llm_prompt_revise.jinja2) this name order still applies.
+FLEX_SHORTEN_ORDER = (
+    "negative_constraints",
+    "constraints",
+    "camera",
+    "composition",
+    "lighting",
+    "style",
+    "subject",
+)
+# Blocks that may be shortened but never removed entirely.
+FLEX_REQUIRED_BLOCKS = frozenset({"subject"})
+# Revise-step block states in shortening order; FROZEN blocks are never touched.
+BLOCK_STATE_ORDER = ("FLEX", "REVISE")
+
+ENUM_PARAMS = {
+    "size": "supported_sizes",
+    "quality": "supported_qualities",
+    "style": "supported_styles",
+}
+
+
+def run(
+    prompt_text: str,
+    capabilities: ProviderCapabilities,
+    image_params: dict[str, Any] | None = None,
+    negative_prompt: str | None = None,
+    block_states: dict[str, str] | None = None,
+) -> PreflightResult:
+    """Validate and normalize a generation request locally, before any provider call.
+
+    block_states is the revise step's FROZEN/REVISE/FLEX map; FROZEN blocks are kept verbatim.
+    """
+    errors: list[PreflightIssue] = []
+    warnings: list[PreflightIssue] = []
+
+    params, param_errors = validate_image_params(image_params or {}, capabilities)
+    errors.extend(param_errors)
+
+    if negative_prompt and not capabilities.supports_negative_prompt:
+        warnings.append(
+            PreflightIssue(
+                code="negative_prompt_dropped",
+                field="negative_prompt",
+                message=f"Provider '{capabilities.provider_name}' ignores negative prompts",
+            )
+        )
+        negative_prompt = None
+
+    if not strip_flex_markers(prompt_text):
+        errors.append(
+            PreflightIssue(code="empty_prompt", field="prompt_text", message="Prompt is empty")
+        )
+    elif capabilities.max_prompt_chars:
+        prompt_text, dropped = shorten_prompt(
+            prompt_text, capabilities.max_prompt_chars, block_states
+        )
+        length = len(strip_flex_markers(prompt_text))
+        if length > capabilities.max_prompt_chars:
+            errors.append(
+                PreflightIssue(
+                    code="prompt_too_long",
+                    field="prompt_text",
+                    message=(
+                        f"Prompt is {length} characters after shortening, "
+                        f"limit is {capabilities.max_prompt_chars}"
+                    ),
+                )
+            )
+        elif dropped:
+            warnings.append(
+                PreflightIssue(
+                    code="prompt_shortened",
+                    field="prompt_text",
+                    message=f"Shortened FLEX blocks to fit limit: {', '.join(dropped)}",
+                )
+            )
+
+    if errors:
+        logger.info(f"Preflight rejected request for {capabilities.provider_name}: {errors}")
+    return PreflightResult(
+        prompt_text=prompt_text,
+        negative_prompt=negative_prompt,
+        image_params=params,
+        errors=errors,
+        warnings=warnings,
+    )
+
+
+def validate_image_params(
+    image_params: dict[str, Any], capabilities: ProviderCapabilities
+) -> tuple[dict[str, Any], list[PreflightIssue]]:
+    """Merge params with provider defaults and check them against the capabilities."""
+    errors: list[PreflightIssue] = []
+    params = {**capabilities.default_params, "size": capabilities.default_size, **image_params}
+
+    for name, value in image_params.items():
+        if name in ENUM_PARAMS:
+            continue
+        if name not in capabilities.default_params:
+            errors.append(
+                PreflightIssue(
+                    code="unknown_param",
+                    field=f"image_params.{name}",
+                    message=f"Provider '{capabilities.provider_name}' has no parameter '{name}'",
+                )
+            )
+            continue
+        default = capabilities.default_params[name]
+        if default is None:
+            # A None default declares an optional parameter of any type.
+            continue
+        expected = type(default)
+        if not _matches_type(value, expected):
+            errors.append(
+                PreflightIssue(
+                    code="invalid_param_type",
+                    field=f"image_params.{name}",
+                    message=f"Expected {expected.__name__}, got {type(value).__name__}",
+                )
+            )
+
+    for name, caps_field in ENUM_PARAMS.items():
+        if name not in params:
+            continue
+        supported: list[str] | None = getattr(capabilities, caps_field)
+        if supported is None:
+            errors.append(
+                PreflightIssue(
+                    code=f"unsupported_{name}",
+                    field=f"image_params.{name}",
+                    message=f"Provider '{capabilities.provider_name}' does not support '{name}'",
+                )
+            )
+        elif params[name] not in supported:
+            errors.append(
+                PreflightIssue(
+                    code=f"unsupported_{name}",
+                    field=f"image_params.{name}",
+                    message=(
+                        f"{name.capitalize()} '{params[name]}' is not supported, "
+                        f"use one of: {', '.join(supported)}"
+                    ),
+                )
+            )
+    return params, errors
+
+
+def shorten_prompt(
+    prompt_text: str, max_chars: int, block_states: dict[str, str] | None = None
+) -> tuple[str, list[str]]:
+    """Trim low-priority FLEX blocks clause by clause until the rendered prompt fits.
+
+    With block_states, FLEX blocks are trimmed before REVISE blocks and FROZEN blocks are
+    never touched; blocks without a state count as FLEX. Without states, the fixed name
+    order decides. Returns the shortened prompt (markers preserved) and the touched block
+    names; the prompt may still exceed max_chars if the blocks cannot absorb the overflow.
+    """
+    touched: list[str] = []
+    blocks = parse_flex_blocks(prompt_text)
+    for name in _shorten_order(blocks, block_states):
+        while len(strip_flex_markers(prompt_text)) > max_chars:
+            shorter = drop_last_clause(blocks[name])
+            if shorter is None:
+                break
+            blocks[name] = shorter
+            prompt_text = replace_flex_block(prompt_text, name, shorter)
+            if name not in touched:
+                touched.append(name)
+        if len(strip_flex_markers(prompt_text)) <= max_chars:
+            break
+        if name not in FLEX_REQUIRED_BLOCKS:
+            prompt_text = remove_flex_block(prompt_text, name)
+            if name not in touched:
+                touched.append(name)
+    return prompt_text, touched
+
+
+def _shorten_order(blocks: dict[str, str], block_states: dict[str, str] | None) -> list[str]:
+    by_priority = [name for name in FLEX_SHORTEN_ORDER if name in blocks]
+    if block_states is None:
+        return by_priority
+    states = {name: block_states.get(name, "FLEX").upper() for name in by_priority}
+    return [name for state in BLOCK_STATE_ORDER for name in by_priority if states[name] == state]
+
+
+def _matches_type(value: object, expected: type) -> bool:
+    if expected is bool or isinstance(value, bool):
+        return type(value) is expected
+    if expected is float:
+        return isinstance(value, int | float)
+    return isinstance(value, expected)
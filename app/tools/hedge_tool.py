@@ -0,0 +1,152 @@
+import asyncio
+import os
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from pydantic import BaseModel, Field
+
+from app.tools.log_tool import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class HedgePolicy(BaseModel):
+    enabled: bool = Field(default=False, description="Whether hedged requests are launched at all")
+    percentile: float = Field(
+        default=0.95, gt=0, lt=1, description="Latency percentile after which a hedge is launched"
+    )
+    min_samples: int = Field(
+        default=20, ge=1, description="Samples needed per provider before hedging kicks in"
+    )
+    window: int = Field(
+        default=100, ge=1, description="Number of recent calls kept for latency and rate stats"
+    )
+    max_hedge_rate: float = Field(
+        default=0.1, ge=0, le=1, description="Max share of recent calls that may be hedged"
+    )
+    fallbacks: dict[str, str] = Field(
+        default_factory=dict,
+        description="Provider to send the hedge to, keyed by primary provider; default: same",
+    )
+
+    @classmethod
+    def from_env(cls) -> "HedgePolicy":
+        """Build a policy from HEDGE_* environment variables."""
+        fallbacks = {}
+        for pair in os.getenv("HEDGE_FALLBACKS", "").split(","):
+            if ":" in pair:
+                primary, fallback = pair.split(":", 1)
+                fallbacks[primary.strip()] = fallback.strip()
+        return cls(
+            enabled=os.getenv("HEDGE_ENABLED", "false").lower() in ("1", "true", "yes"),
+            percentile=float(os.getenv("HEDGE_PERCENTILE", "0.95")),
+            max_hedge_rate=float(os.getenv("HEDGE_MAX_RATE", "0.1")),
+            fallbacks=fallbacks,
+        )
+
+
+class LatencyStats:
+    """Rolling per-provider latency samples."""
+
+    def __init__(self, window: int = 100):
+        self.window = window
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, provider: str, seconds: float) -> None:
+        """Add a latency sample for a provider."""
+        self._samples.setdefault(provider, deque(maxlen=self.window)).append(seconds)
+
+    def count(self, provider: str) -> int:
+        """Return the number of samples currently held for a provider."""
+        return len(self._samples.get(provider, ()))
+
+    def percentile(self, provider: str, q: float) -> float | None:
+        """Return the q-th latency percentile (nearest rank), or None without samples."""
+        samples = self._samples.get(provider)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        rank = min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))
+        return ordered[rank]
+
+
+class HedgeTool:
+    """Run provider calls with an optional latency-triggered duplicate request."""
+
+    def __init__(self, policy: HedgePolicy | None = None, stats: LatencyStats | None = None):
+        self.policy = policy or HedgePolicy.from_env()
+        self.stats = stats or LatencyStats(window=self.policy.window)
+        self._recent_hedges: deque[bool] = deque(maxlen=self.policy.window)
+
+    @property
+    def hedge_rate(self) -> float:
+        """Share of recent calls that launched a hedge."""
+        if not self._recent_hedges:
+            return 0.0
+        return sum(self._recent_hedges) / len(self._recent_hedges)
+
+    def hedge_delay(self, provider: str) -> float | None:
+        """Return how long to wait before hedging a call, or None if it must not be hedged."""
+        if not self.policy.enabled or self.stats.count(provider) < self.policy.min_samples:
+            return None
+        if self.hedge_rate >= self.policy.max_hedge_rate:
+            return None
+        return self.stats.percentile(provider, self.policy.percentile)
+
+    async def call(self, provider: str, make_call: Callable[[str], Awaitable[T]]) -> T:
+        """Await make_call(provider), hedging it if it runs past the provider's percentile.
+
+        make_call receives the provider name so the hedge can target a configured fallback.
+        The first successful result wins; the other call is cancelled. If both fail, the
+        primary call's exception is raised. Cancelling the caller cancels both calls.
+        """
+        delay = self.hedge_delay(provider)
+        started = time.perf_counter()
+        primary = asyncio.create_task(self._timed(provider, make_call))
+        hedge: asyncio.Task[T] | None = None
+        try:
+            if delay is None:
+                self._recent_hedges.append(False)
+                return await primary
+
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done or not self._reserve_hedge():
+                self._recent_hedges.append(False)
+                return await primary
+
+            hedge_provider = self.policy.fallbacks.get(provider, provider)
+            logger.info(f"Hedging {provider} call after {delay:.2f}s via {hedge_provider}")
+            hedge = asyncio.create_task(self._timed(hedge_provider, make_call))
+            pending: set[asyncio.Task[T]] = {primary, hedge}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if not task.cancelled() and task.exception() is None:
+                        return task.result()
+            return primary.result()
+        finally:
+            if hedge is not None and not primary.done():
+                # The primary lost the race; it took at least this long, which keeps
+                # slow tails visible without waiting for it to finish.
+                self.stats.record(provider, time.perf_counter() - started)
+            primary.cancel()
+            if hedge is not None:
+                hedge.cancel()
+
+    def _reserve_hedge(self) -> bool:
+        """Claim a hedge slot if the budget allows; check and claim happen without yielding."""
+        if self.hedge_rate >= self.policy.max_hedge_rate:
+            return False
+        self._recent_hedges.append(True)
+        return True
+
+    async def _timed(self, provider: str, make_call: Callable[[str], Awaitable[T]]) -> T:
+        # Only completed calls are samples; a cancelled call's partial time says nothing.
+        started = time.perf_counter()
+        result = await make_call(provider)
+        self.stats.record(provider, time.perf_counter() - started)
+        return result
@@ -0,0 +1,133 @@
+import json
+import os
+from collections.abc import AsyncGenerator, AsyncIterator
+from typing import Any
+
+import httpx
+
+from app.tools.hedge_tool import HedgeTool
+from app.tools.log_tool import get_logger
+from app.utils.json_stream_utils import iter_json_fields
+
+logger = get_logger(__name__)
+
+DEFAULT_BASE_URL = "https://openrouter.ai/api/v1"
+DEFAULT_MODEL = "x-ai/grok-4"
+# Hedge latency stats for OpenRouter calls are kept under this name; hedges re-call OpenRouter.
+HEDGE_PROVIDER = "openrouter"
+
+
+class OpenRouterTool:
+    """Async OpenRouter chat completions client with streaming support.
+
+    One pooled HTTP client is kept for the tool's lifetime; close it with aclose() or use
+    the tool as an async context manager. With a HedgeTool, streamed JSON calls are
+    hedged on time to first field.
+    """
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        model: str | None = None,
+        client: httpx.AsyncClient | None = None,
+        timeout: float = 60.0,
+        hedge: HedgeTool | None = None,
+    ):
+        self.api_key = api_key or os.getenv("OPENROUTER_API_KEY", "")
+        base_url = base_url or os.getenv("OPENROUTER_BASE_URL") or DEFAULT_BASE_URL
+        self.base_url = base_url.rstrip("/")
+        self.model = model or os.getenv("OPENROUTER_MODEL", DEFAULT_MODEL)
+        self.timeout = timeout
+        self.hedge = hedge
+        self._client = client or httpx.AsyncClient(timeout=timeout)
+
+    async def __aenter__(self) -> "OpenRouterTool":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
+
+    async def stream_completion(
+        self, messages: list[dict[str, Any]], model: str | None = None
+    ) -> AsyncIterator[str]:
+        """Stream a chat completion, yielding content deltas as they arrive."""
+        async with self._client.stream(
+            "POST",
+            f"{self.base_url}/chat/completions",
+            headers={"Authorization": f"Bearer {self.api_key}"},
+            json={"model": model or self.model, "messages": messages, "stream": True},
+            timeout=self.timeout,
+        ) as response:
+            if response.status_code != 200:
+                body = await response.aread()
+                raise httpx.HTTPStatusError(
+                    f"OpenRouter error {response.status_code}: {body.decode()[:500]}",
+                    request=response.request,
+                    response=response,
+                )
+            async for line in response.aiter_lines():
+                if line.strip() == "data: [DONE]":
+                    break
+                content = _parse_sse_line(line)
+                if content:
+                    yield content
+
+    async def stream_json_fields(
+        self, messages: list[dict[str, Any]], model: str | None = None
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """Stream a JSON-object completion, yielding each top-level field once it closes.
+
+        Lets callers act on early fields (e.g. 'revised_prompt', 'score') while the rest of
+        the completion is still being generated.
+        """
+        if self.hedge is None:
+            fields = iter_json_fields(self.stream_completion(messages, model))
+            first = None
+        else:
+            first, fields = await self.hedge.call(
+                HEDGE_PROVIDER, lambda _: self._open_json_fields(messages, model)
+            )
+        try:
+            if first is not None:
+                yield first
+            async for field in fields:
+                yield field
+        finally:
+            await fields.aclose()
+
+    async def _open_json_fields(
+        self, messages: list[dict[str, Any]], model: str | None
+    ) -> tuple[tuple[str, Any], AsyncGenerator[tuple[str, Any], None]]:
+        """Start a streamed JSON completion and wait for its first field."""
+        fields = iter_json_fields(self.stream_completion(messages, model))
+        try:
+            first = await anext(fields)
+        except StopAsyncIteration:
+            await fields.aclose()
+            raise ValueError("OpenRouter returned an empty completion") from None
+        except BaseException:
+            # Includes cancellation of a losing hedge: close its HTTP stream.
+            await fields.aclose()
+            raise
+        return first, fields
+
+
+def _parse_sse_line(line: str) -> str | None:
+    """Return the content delta of an SSE data line, or None for comments and empty deltas."""
+    if not line.startswith("data:"):
+        return None
+    payload = line[len("data:") :].strip()
+    try:
+        data = json.loads(payload)
+    except json.JSONDecodeError:
+        logger.warning(f"Skipping unparseable OpenRouter stream line: {payload[:200]}")
+        return None
+    if "error" in data:
+        raise RuntimeError(f"OpenRouter stream error: {data['error']}")
+    choices = data.get("choices") or [{}]
+    return choices[0].get("delta", {}).get("content") or None
@@ -0,0 +1,46 @@
+import re
+
+FLEX_BLOCK_RE = re.compile(
+    r"## FLEX_BEGIN:(?P<name>\w+)[ \t]*\n(?P<content>.*?)\n?## FLEX_END:(?P=name)[ \t]*\n?",
+    re.DOTALL,
+)
+FLEX_MARKER_RE = re.compile(r"^## FLEX_(?:BEGIN|END):\w+[ \t]*\n?", re.MULTILINE)
+CLAUSE_SPLIT_RE = re.compile(r"(?<=[,;.])\s+")
+
+
+def parse_flex_blocks(prompt: str) -> dict[str, str]:
+    """Return FLEX block contents keyed by block name, in prompt order."""
+    return {m.group("name"): m.group("content").strip() for m in FLEX_BLOCK_RE.finditer(prompt)}
+
+
+def replace_flex_block(prompt: str, name: str, content: str) -> str:
+    """Replace the content of a named FLEX block, keeping its markers."""
+
+    def _sub(match: re.Match[str]) -> str:
+        if match.group("name") != name:
+            return match.group(0)
+        return f"## FLEX_BEGIN:{name}\n{content}\n## FLEX_END:{name}\n"
+
+    return FLEX_BLOCK_RE.sub(_sub, prompt)
+
+
+def remove_flex_block(prompt: str, name: str) -> str:
+    """Remove a named FLEX block together with its markers."""
+
+    def _sub(match: re.Match[str]) -> str:
+        return "" if match.group("name") == name else match.group(0)
+
+    return re.sub(r"\n{3,}", "\n\n", FLEX_BLOCK_RE.sub(_sub, prompt)).strip()
+
+
+def strip_flex_markers(prompt: str) -> str:
+    """Return the prompt as sent to a provider, without FLEX marker lines."""
+    return re.sub(r"\n{3,}", "\n\n", FLEX_MARKER_RE.sub("", prompt)).strip()
+
+
+def drop_last_clause(text: str) -> str | None:
+    """Drop the trailing comma/semicolon/sentence clause, or return None if only one is left."""
+    clauses = CLAUSE_SPLIT_RE.split(text.strip())
+    if len(clauses) <= 1:
+        return None
+    return " ".join(clauses[:-1]).rstrip(",;")
@@ -0,0 +1,153 @@
+import json
+from collections.abc import AsyncGenerator, AsyncIterator
+from typing import Any
+
+
+def parse_llm_json(text: str) -> dict[str, Any]:
+    """Parse a JSON object from LLM output, tolerating markdown fences and stray prose."""
+    decoder = json.JSONDecoder()
+    start = text.find("{")
+    while start != -1:
+        try:
+            data, _ = decoder.raw_decode(text, start)
+        except json.JSONDecodeError:
+            data = None
+        if isinstance(data, dict):
+            return data
+        start = text.find("{", start + 1)
+    raise ValueError("No JSON object found in LLM output")
+
+
+class JsonFieldStream:
+    """Incremental parser emitting top-level fields of a JSON object as soon as they close.
+
+    Text before the opening brace (markdown fences, prose) is skipped. Once the output
+    stops looking like JSON the parser goes quiet and leaves the rest to parse_llm_json.
+    """
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.done = False
+        self.malformed = False
+        self._pos = 0
+        self._depth = 0
+        self._state = "start"
+        self._in_string = False
+        self._escape = False
+        self._key = ""
+        self._token_start = 0
+
+    def feed(self, chunk: str) -> list[tuple[str, Any]]:
+        """Consume a chunk of text and return the fields completed by it."""
+        self.text += chunk
+        fields: list[tuple[str, Any]] = []
+        while self._pos < len(self.text) and not self.done and not self.malformed:
+            field = self._step(self.text[self._pos], self._pos)
+            self._pos += 1
+            if field is not None:
+                fields.append(field)
+        return fields
+
+    def _step(self, char: str, pos: int) -> tuple[str, Any] | None:
+        if self._state == "start":
+            if char == "{":
+                self._depth, self._state = 1, "key"
+            return None
+
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                if self._depth == 1 and self._state == "key_string":
+                    self._key = self._load(self.text[self._token_start : pos + 1])
+                    self._state = "colon"
+                elif self._depth == 1 and self._state == "value":
+                    self._state = "comma"
+                    return self._emit(self.text[self._token_start : pos + 1])
+            return None
+
+        if char.isspace():
+            return None
+        if self._depth > 1:
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 1:
+                    self._state = "comma"
+                    return self._emit(self.text[self._token_start : pos + 1])
+            return None
+
+        if self._state == "key":
+            if char == '"':
+                self._in_string, self._state, self._token_start = True, "key_string", pos
+            elif char == "}":
+                self.done = True
+            else:
+                self.malformed = True
+        elif self._state == "colon":
+            if char == ":":
+                self._state = "value_start"
+            else:
+                self.malformed = True
+        elif self._state == "value_start":
+            self._state, self._token_start = "value", pos
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+        elif self._state == "value" and char in ",}":
+            self._state = "key"
+            self.done = char == "}"
+            return self._emit(self.text[self._token_start : pos])
+        elif self._state == "comma":
+            if char == ",":
+                self._state = "key"
+            elif char == "}":
+                self.done = True
+            else:
+                self.malformed = True
+        return None
+
+    def _emit(self, raw: str) -> tuple[str, Any] | None:
+        value = self._load(raw.strip())
+        return None if self.malformed else (self._key, value)
+
+    def _load(self, raw: str) -> Any:
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            self.malformed = True
+            return None
+
+
+async def iter_json_fields(
+    chunks: AsyncIterator[str],
+) -> AsyncGenerator[tuple[str, Any], None]:
+    """Yield (field, value) pairs of a streamed JSON object in the order they complete.
+
+    Fields the incremental parser could not emit are recovered with a full parse of the
+    accumulated text once the stream ends.
+    """
+    parser = JsonFieldStream()
+    emitted: set[str] = set()
+    try:
+        async for chunk in chunks:
+            for key, value in parser.feed(chunk):
+                emitted.add(key)
+                yield key, value
+    finally:
+        # Close the source stream (and its HTTP response) when the consumer stops early.
+        aclose = getattr(chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+    if parser.done and not parser.malformed:
+        return
+    for key, value in parse_llm_json(parser.text).items():
+        if key not in emitted:
+            yield key, value
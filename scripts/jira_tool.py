@@ -2,9 +2,17 @@
 
 import argparse
 import asyncio
+import csv
+import importlib.util
+import json
 import logging
 import os
 import sys
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from datetime import UTC, datetime, timedelta
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any
 
 import httpx
 from dotenv import load_dotenv
@@ -24,6 +32,92 @@ ISSUE_TYPES = {
     "epic": "Эпик",
 }
 
+SEARCH_FIELDS = "summary,status,issuetype,parent,priority,created,updated"
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+RETRY_STATUSES = (429, 503)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+MAX_RETRIES = 5
+DEFAULT_MAX_CONNECTIONS = 10
+# Transport errors raised before the request left the client; safe to retry for any method.
+UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+RETRY_BASE_DELAY = 1.0
+MAX_RETRY_DELAY = 60.0
+# JQL date literals have no offset and are read in the searching user's profile
+# timezone; querying from a day before the UTC watermark covers any profile offset.
+SYNC_OVERLAP = timedelta(days=1)
+JQL_DATE_FORMAT = "%Y-%m-%d %H:%M"
+
+
+class JiraError(Exception):
+    """JIRA API returned an unexpected status."""
+
+    def __init__(self, status_code: int, text: str, action: str = "Failed"):
+        super().__init__(f"{action} ({status_code}): {text}")
+        self.status_code = status_code
+
+
+class IssueCache:
+    """On-disk cache of issues keyed by issue key, with the last sync watermark in UTC."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.last_sync: str | None = None
+        self.issues: dict[str, dict] = {}
+        if path.exists():
+            data = json.loads(path.read_text(encoding="utf-8"))
+            self.last_sync = data.get("last_sync")
+            self.issues = data.get("issues", {})
+
+    @classmethod
+    def for_project(cls, project: str) -> "IssueCache":
+        """Return the cache for a project under JIRA_CACHE_DIR."""
+        cache_dir = Path(os.getenv("JIRA_CACHE_DIR", ".jira_cache"))
+        return cls(cache_dir / f"{project}.json")
+
+    def save(self) -> None:
+        """Write the cache atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps(
+                {"last_sync": self.last_sync, "issues": self.issues}, ensure_ascii=False
+            ),
+            encoding="utf-8",
+        )
+        tmp.replace(self.path)
+
+    def upsert(self, issue: dict) -> None:
+        """Store an issue, keeping only the fields used for listing."""
+        fields = {name: issue["fields"].get(name) for name in SEARCH_FIELDS.split(",")}
+        self.issues[issue["key"]] = {"key": issue["key"], "fields": fields}
+
+    def get(self, issue_key: str) -> dict | None:
+        """Return a cached issue, or None if it is not cached."""
+        return self.issues.get(issue_key)
+
+    def subtasks(self, issue_key: str) -> list[dict]:
+        """Return cached subtasks of an issue, resolved from their parent links."""
+        return sorted(
+            (
+                issue
+                for issue in self.issues.values()
+                if (issue["fields"].get("parent") or {}).get("key") == issue_key
+                and issue["fields"]["issuetype"].get("subtask")
+            ),
+            key=lambda issue: issue["key"],
+        )
+
+    def search(self, issue_type: str | None = None) -> list[dict]:
+        """Return cached issues, newest first, optionally filtered by type name."""
+        issues = [
+            issue
+            for issue in self.issues.values()
+            if issue_type is None or issue["fields"]["issuetype"]["name"] == issue_type
+        ]
+        return sorted(
+            issues, key=lambda i: i["fields"].get("created") or "", reverse=True
+        )
+
 
 class JiraTool:
     """Async JIRA REST API client."""
@@ -34,6 +128,8 @@ class JiraTool:
         email: str | None = None,
         api_token: str | None = None,
         project: str | None = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         self.host = host or os.getenv("JIRA_HOST", "")
         self.email = email or os.getenv("JIRA_EMAIL", "")
@@ -45,6 +141,68 @@ class JiraTool:
         self._host_url = _host
         self.base_url = f"{_host}/rest/api/3"
         self._validate_config()
+        self._client = httpx.AsyncClient(
+            auth=self._get_auth(),
+            headers={"Content-Type": "application/json"},
+            timeout=15.0,
+            http2=HTTP2_AVAILABLE and transport is None,
+            limits=httpx.Limits(max_connections=max_connections),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "JiraTool":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        expected: int,
+        action: str = "Failed",
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request on the pooled client, retrying 429/503 and transport errors.
+
+        Retry-After is honored on 429/503. Transport errors are retried when the request
+        cannot have reached JIRA (connect and pool errors) or when the method is idempotent, so a
+        POST is never sent twice.
+        """
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = await self._client.request(
+                    method, f"{self.base_url}{path}", **kwargs
+                )
+            except httpx.TransportError as e:
+                retryable = method in IDEMPOTENT_METHODS or isinstance(e, UNSENT_ERRORS)
+                if not retryable or attempt == MAX_RETRIES:
+                    raise
+                delay = min(RETRY_BASE_DELAY * 2**attempt, MAX_RETRY_DELAY)
+                logger.info(
+                    f"\033[33m{type(e).__name__} on {method} {path}, "
+                    f"retrying in {delay:.1f}s\033[0m"
+                )
+                await asyncio.sleep(delay)
+                continue
+            if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                break
+            delay = _retry_after(response)
+            if delay is None:
+                delay = min(RETRY_BASE_DELAY * 2**attempt, MAX_RETRY_DELAY)
+            logger.info(
+                f"\033[33m{response.status_code} on {method} {path}, "
+                f"retrying in {delay:.1f}s\033[0m"
+            )
+            await asyncio.sleep(delay)
+        if response.status_code != expected:
+            raise JiraError(response.status_code, response.text, action)
+        return response
 
     def _validate_config(self) -> None:
         """Validate that JIRA credentials are set."""
@@ -140,27 +298,12 @@ class JiraTool:
                 description=description or "",
                 acceptance_criteria=acceptance_criteria,
             )
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/issue",
-                auth=self._get_auth(),
-                headers={"Content-Type": "application/json"},
-                json={"fields": fields},
-                timeout=15.0,
-            )
-        if response.status_code == 201:
-            data = response.json()
-            key = data["key"]
-            print(
-                f"\033[32m✓\033[0m Created {jira_type}: "
-                f"\033[36m{key}\033[0m — {summary}"
-            )
-            print(f"  \033[34m{self._browse_url(key)}\033[0m")
-            return data
-        logger.error(
-            f"\033[31m✗ Failed ({response.status_code}): {response.text}\033[0m"
-        )
-        sys.exit(1)
+        response = await self._request("POST", "/issue", 201, json={"fields": fields})
+        data = response.json()
+        key = data["key"]
+        print(f"\033[32m✓\033[0m Created {jira_type}: \033[36m{key}\033[0m — {summary}")
+        print(f"  \033[34m{self._browse_url(key)}\033[0m")
+        return data
 
     async def update_issue(
         self,
@@ -183,59 +326,51 @@ class JiraTool:
                 "\033[31mNothing to update. Use --summary, --description, or --ac.\033[0m"
             )
             sys.exit(1)
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{self.base_url}/issue/{issue_key}",
-                auth=self._get_auth(),
-                headers={"Content-Type": "application/json"},
-                json={"fields": fields},
-                timeout=15.0,
-            )
-        if response.status_code == 204:
-            print(f"\033[32m✓\033[0m Updated: \033[36m{issue_key}\033[0m")
-            return
-        logger.error(
-            f"\033[31m✗ Failed ({response.status_code}): {response.text}\033[0m"
+        await self._request("PUT", f"/issue/{issue_key}", 204, json={"fields": fields})
+        print(f"\033[32m✓\033[0m Updated: \033[36m{issue_key}\033[0m")
+
+    async def _search_page(self, jql: str, page_size: int, token: str | None) -> dict:
+        """Fetch one page of JQL search results."""
+        params: dict = {"jql": jql, "maxResults": page_size, "fields": SEARCH_FIELDS}
+        if token:
+            params["nextPageToken"] = token
+        response = await self._request(
+            "GET", "/search/jql", 200, action="Search failed", params=params
         )
-        sys.exit(1)
+        return response.json()
 
     async def list_issues(
         self,
         jql: str,
-        max_results: int = 50,
-    ) -> list[dict]:
-        """Search JIRA issues by JQL."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/search/jql",
-                auth=self._get_auth(),
-                params={
-                    "jql": jql,
-                    "maxResults": max_results,
-                    "fields": "summary,status,issuetype,parent,priority",
-                },
-                timeout=15.0,
-            )
-        if response.status_code != 200:
-            logger.error(
-                f"\033[31m✗ Search failed ({response.status_code}): {response.text}\033[0m"
-            )
-            sys.exit(1)
-        data = response.json()
-        issues = data.get("issues", [])
-        print(f"\033[33m{len(issues)}\033[0m issues found:\n")
-        for issue in issues:
-            fields = issue["fields"]
-            key = issue["key"]
-            issue_summary = fields["summary"]
-            status = fields["status"]["name"]
-            issue_type = fields["issuetype"]["name"]
-            parent_key = fields["parent"]["key"] if fields.get("parent") else "—"
-            print(
-                f"  \033[36m{key}\033[0m [{issue_type}] {issue_summary}  "
-                f"(\033[33m{status}\033[0m, parent: {parent_key})"
-            )
-        return issues
+        max_results: int | None = 50,
+        page_size: int = 100,
+    ) -> AsyncIterator[dict]:
+        """Search JIRA issues by JQL, following page tokens with one page of read-ahead."""
+        if max_results is not None:
+            page_size = min(page_size, max_results)
+        pending: asyncio.Task | None = asyncio.create_task(
+            self._search_page(jql, page_size, None)
+        )
+        yielded = 0
+        try:
+            while pending is not None:
+                data = await pending
+                pending = None
+                issues = data.get("issues", [])
+                token = data.get("nextPageToken")
+                wanted_more = max_results is None or yielded + len(issues) < max_results
+                if token and not data.get("isLast", False) and wanted_more:
+                    pending = asyncio.create_task(
+                        self._search_page(jql, page_size, token)
+                    )
+                for issue in issues:
+                    if max_results is not None and yielded >= max_results:
+                        return
+                    yield issue
+                    yielded += 1
+        finally:
+            if pending is not None:
+                pending.cancel()
 
     async def add_comment(self, issue_key: str, text: str) -> None:
         """Add a comment to a JIRA issue."""
@@ -246,76 +381,202 @@ class JiraTool:
                 {"type": "paragraph", "content": [{"type": "text", "text": text}]}
             ],
         }
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/issue/{issue_key}/comment",
-                auth=self._get_auth(),
-                headers={"Content-Type": "application/json"},
-                json={"body": body},
-                timeout=15.0,
-            )
-        if response.status_code == 201:
-            print(f"\033[32m✓\033[0m Comment added to \033[36m{issue_key}\033[0m")
-            return
-        logger.error(
-            f"\033[31m✗ Failed ({response.status_code}): {response.text}\033[0m"
+        await self._request(
+            "POST", f"/issue/{issue_key}/comment", 201, json={"body": body}
         )
-        sys.exit(1)
+        print(f"\033[32m✓\033[0m Comment added to \033[36m{issue_key}\033[0m")
 
     async def transition_issue(self, issue_key: str, transition_id: str) -> None:
         """Transition a JIRA issue to a new status."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/issue/{issue_key}/transitions",
-                auth=self._get_auth(),
-                headers={"Content-Type": "application/json"},
-                json={"transition": {"id": transition_id}},
-                timeout=15.0,
-            )
-        if response.status_code == 204:
-            print(
-                f"\033[32m✓\033[0m Transitioned: \033[36m{issue_key}\033[0m → {transition_id}"
-            )
-            return
-        logger.error(
-            f"\033[31m✗ Failed ({response.status_code}): {response.text}\033[0m"
+        await self._request(
+            "POST",
+            f"/issue/{issue_key}/transitions",
+            204,
+            json={"transition": {"id": transition_id}},
+        )
+        print(
+            f"\033[32m✓\033[0m Transitioned: \033[36m{issue_key}\033[0m → {transition_id}"
         )
-        sys.exit(1)
 
     async def get_issue(self, issue_key: str) -> dict:
         """Get a single JIRA issue details."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/issue/{issue_key}",
-                auth=self._get_auth(),
-                params={
-                    "fields": "summary,status,issuetype,parent,priority,description,subtasks",
-                },
-                timeout=15.0,
-            )
-        if response.status_code != 200:
-            logger.error(
-                f"\033[31m✗ Failed ({response.status_code}): {response.text}\033[0m"
-            )
-            sys.exit(1)
-        data = response.json()
-        fields = data["fields"]
-        print(f"\033[36m{issue_key}\033[0m — {fields['summary']}")
-        print(
-            f"  Type: {fields['issuetype']['name']}  "
-            f"Status: \033[33m{fields['status']['name']}\033[0m"
+        response = await self._request(
+            "GET",
+            f"/issue/{issue_key}",
+            200,
+            params={"fields": f"{SEARCH_FIELDS},description,subtasks"},
         )
-        if fields.get("parent"):
-            print(f"  Parent: {fields['parent']['key']}")
-        if fields.get("subtasks"):
-            print("  Subtasks:")
-            for st in fields["subtasks"]:
-                print(
-                    f"    \033[36m{st['key']}\033[0m — {st['fields']['summary']} "
-                    f"(\033[33m{st['fields']['status']['name']}\033[0m)"
-                )
+        data = response.json()
+        print_issue_details(data, data["fields"].get("subtasks") or [])
         return data
 
+    async def sync_cache(self, cache: IssueCache, full: bool = False) -> int:
+        """Fetch issues updated since the last sync into the cache; return the count."""
+        jql = f"project = {self.project}"
+        if cache.last_sync and not full:
+            since = datetime.strptime(cache.last_sync, JQL_DATE_FORMAT) - SYNC_OVERLAP
+            jql += f' AND updated >= "{since.strftime(JQL_DATE_FORMAT)}"'
+        if full:
+            cache.issues.clear()
+        count = 0
+        latest = cache.last_sync or ""
+        async for issue in self.list_issues(
+            jql=f"{jql} ORDER BY updated ASC", max_results=None
+        ):
+            cache.upsert(issue)
+            count += 1
+            latest = max(latest, _utc_minute(issue["fields"].get("updated")))
+        cache.last_sync = latest or None
+        cache.save()
+        return count
+
+    async def _run_bulk(
+        self,
+        items: Iterable[Any],
+        action: Callable[[Any], Awaitable[Any]],
+        label: Callable[[Any], str],
+        concurrency: int,
+    ) -> int:
+        """Run action over items concurrently under a limit; return the failure count."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(item: Any) -> bool:
+            async with semaphore:
+                try:
+                    await action(item)
+                except (JiraError, httpx.HTTPError) as e:
+                    logger.error(f"\033[31m✗ {label(item)}: {e}\033[0m")
+                    return False
+                return True
+
+        results = await asyncio.gather(*(run(item) for item in items))
+        failed = results.count(False)
+        color = "31" if failed else "32"
+        print(f"\n\033[{color}m{len(results) - failed}/{len(results)}\033[0m succeeded")
+        return failed
+
+    async def bulk_create(self, rows: list[dict], concurrency: int = 5) -> int:
+        """Create issues from rows with type, summary, parent, description, ac, project."""
+        for row in rows:
+            self._resolve_issue_type(row.get("type", ""))
+            if not row.get("summary"):
+                logger.error(f"\033[31mRow without summary: {row}\033[0m")
+                sys.exit(1)
+        return await self._run_bulk(
+            rows,
+            lambda row: self.create_issue(
+                issue_type=row["type"],
+                summary=row["summary"],
+                parent=row.get("parent") or None,
+                description=row.get("description") or None,
+                acceptance_criteria=row.get("ac") or None,
+                project=row.get("project") or None,
+            ),
+            lambda row: row["summary"],
+            concurrency,
+        )
+
+    async def bulk_transition(
+        self, issue_keys: list[str], transition_id: str, concurrency: int = 5
+    ) -> int:
+        """Transition many issues to the same status."""
+        return await self._run_bulk(
+            issue_keys,
+            lambda key: self.transition_issue(key, transition_id),
+            str,
+            concurrency,
+        )
+
+    async def bulk_comment(
+        self, issue_keys: list[str], text: str, concurrency: int = 5
+    ) -> int:
+        """Add the same comment to many issues."""
+        return await self._run_bulk(
+            issue_keys,
+            lambda key: self.add_comment(key, text),
+            str,
+            concurrency,
+        )
+
+
+def _utc_minute(timestamp: str | None) -> str:
+    """Convert a JIRA timestamp with offset to a UTC "yyyy-MM-dd HH:mm" watermark."""
+    if not timestamp:
+        return ""
+    parsed = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%f%z")
+    return parsed.astimezone(UTC).strftime(JQL_DATE_FORMAT)
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return min(max(float(value), 0.0), MAX_RETRY_DELAY)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    date = response.headers.get("Date")
+    now = parsedate_to_datetime(date) if date else None
+    if now is None or retry_at.tzinfo is None:
+        return None
+    return min(max((retry_at - now).total_seconds(), 0.0), MAX_RETRY_DELAY)
+
+
+def print_issue_details(issue: dict, subtasks: list[dict]) -> None:
+    """Print an issue with its parent and subtasks."""
+    fields = issue["fields"]
+    print(f"\033[36m{issue['key']}\033[0m — {fields['summary']}")
+    print(
+        f"  Type: {fields['issuetype']['name']}  "
+        f"Status: \033[33m{fields['status']['name']}\033[0m"
+    )
+    if fields.get("parent"):
+        print(f"  Parent: {fields['parent']['key']}")
+    if subtasks:
+        print("  Subtasks:")
+        for st in subtasks:
+            print(
+                f"    \033[36m{st['key']}\033[0m — {st['fields']['summary']} "
+                f"(\033[33m{st['fields']['status']['name']}\033[0m)"
+            )
+
+
+def print_issue_line(issue: dict) -> None:
+    """Print a one-line summary of a search result issue."""
+    fields = issue["fields"]
+    parent_key = fields["parent"]["key"] if fields.get("parent") else "—"
+    print(
+        f"  \033[36m{issue['key']}\033[0m [{fields['issuetype']['name']}] {fields['summary']}  "
+        f"(\033[33m{fields['status']['name']}\033[0m, parent: {parent_key})"
+    )
+
+
+def load_issue_rows(path: Path) -> list[dict]:
+    """Load bulk-create rows from a JSON list or a CSV file (ac separated by '|')."""
+    if path.suffix.lower() == ".csv":
+        with path.open(newline="", encoding="utf-8") as f:
+            rows = [dict(row) for row in csv.DictReader(f)]
+        for row in rows:
+            row["ac"] = [
+                c.strip() for c in (row.get("ac") or "").split("|") if c.strip()
+            ]
+        return rows
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, list):
+        logger.error(f"\033[31m{path} must contain a JSON list of issues\033[0m")
+        sys.exit(1)
+    for row in data:
+        ac = row.get("ac") or []
+        if isinstance(ac, str):
+            ac = ac.split("|")
+        row["ac"] = [c.strip() for c in ac if c.strip()]
+    return data
+
 
 def build_parser() -> argparse.ArgumentParser:
     """Build CLI argument parser."""
@@ -330,8 +591,13 @@ def build_parser() -> argparse.ArgumentParser:
   python scripts/jira_tool.py list --project SFU --type story
   python scripts/jira_tool.py list --project SFU --jql "status != Done"
   python scripts/jira_tool.py get SFU-10
+  python scripts/jira_tool.py get SFU-10 --offline
+  python scripts/jira_tool.py sync --full
   python scripts/jira_tool.py transition SFU-21 --status-id 41
   python scripts/jira_tool.py comment SFU-21 --body "Реализовано. Issues: none."
+  python scripts/jira_tool.py bulk-create issues.csv --concurrency 8
+  python scripts/jira_tool.py bulk-transition SFU-21 SFU-22 SFU-23 --status-id 41
+  python scripts/jira_tool.py bulk-comment SFU-21 SFU-22 --body "Released in 0.2"
 """,
     )
     subparsers = parser.add_subparsers(dest="command", required=True)
@@ -384,11 +650,35 @@ def build_parser() -> argparse.ArgumentParser:
         "--max",
         type=int,
         default=50,
-        help="Max results",
+        help="Max results (0 for all)",
+    )
+    list_parser.add_argument(
+        "--page-size",
+        type=int,
+        default=100,
+        help="Results per search request",
+    )
+    list_parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve from the local cache without network calls",
     )
 
     get_parser = subparsers.add_parser("get", help="Get issue details")
     get_parser.add_argument("key", help="Issue key (e.g. ARCHIE-10)")
+    get_parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve from the local cache without network calls",
+    )
+
+    sync_parser = subparsers.add_parser("sync", help="Refresh the local issue cache")
+    sync_parser.add_argument("--project", default=None, help="Project key (e.g. SFU)")
+    sync_parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Rebuild the cache from scratch (drops deleted issues)",
+    )
 
     comment_parser = subparsers.add_parser("comment", help="Add a comment to an issue")
     comment_parser.add_argument("key", help="Issue key (e.g. SFU-21)")
@@ -405,6 +695,41 @@ def build_parser() -> argparse.ArgumentParser:
         help="Transition ID: 2=PR OPEN, 11=К выполнению, 21=В работе, 31=Postponed, 41=Готово",
     )
 
+    bulk_create_parser = subparsers.add_parser(
+        "bulk-create", help="Create issues from a JSON or CSV file"
+    )
+    bulk_create_parser.add_argument(
+        "file",
+        type=Path,
+        help="JSON list or CSV with columns: type, summary, parent, description, ac, project",
+    )
+
+    bulk_transition_parser = subparsers.add_parser(
+        "bulk-transition", help="Transition many issues"
+    )
+    bulk_transition_parser.add_argument("keys", nargs="+", help="Issue keys")
+    bulk_transition_parser.add_argument(
+        "--status-id", required=True, dest="transition_id", help="Transition ID"
+    )
+
+    bulk_comment_parser = subparsers.add_parser(
+        "bulk-comment", help="Add the same comment to many issues"
+    )
+    bulk_comment_parser.add_argument("keys", nargs="+", help="Issue keys")
+    bulk_comment_parser.add_argument("--body", required=True, help="Comment text")
+
+    for bulk_parser in (
+        bulk_create_parser,
+        bulk_transition_parser,
+        bulk_comment_parser,
+    ):
+        bulk_parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=5,
+            help="Max requests in flight",
+        )
+
     return parser
 
 
@@ -412,8 +737,20 @@ async def main() -> None:
     """CLI entry point."""
     parser = build_parser()
     args = parser.parse_args()
-    jira = JiraTool()
+    # Give every bulk worker its own connection so none waits into a PoolTimeout.
+    max_connections = max(DEFAULT_MAX_CONNECTIONS, getattr(args, "concurrency", 0))
+    async with JiraTool(max_connections=max_connections) as jira:
+        try:
+            failed = await run_command(jira, args)
+        except JiraError as e:
+            logger.error(f"\033[31m✗ {e}\033[0m")
+            sys.exit(1)
+    if failed:
+        sys.exit(1)
 
+
+async def run_command(jira: JiraTool, args: argparse.Namespace) -> int:
+    """Dispatch a parsed CLI command; return the number of failed bulk items."""
     if args.command == "create":
         await jira.create_issue(
             issue_type=args.type,
@@ -433,22 +770,76 @@ async def main() -> None:
     elif args.command == "list":
         jql_parts = []
         project = getattr(args, "project", None) or jira.project
+        jira.project = project
+        cache = IssueCache.for_project(project)
         jql_parts.append(f"project = {project}")
+        jira_type = None
         if getattr(args, "issue_type", None):
             jira_type = jira._resolve_issue_type(args.issue_type)
             jql_parts.append(f'issuetype = "{jira_type}"')
         if getattr(args, "jql", None):
+            if args.offline:
+                logger.error("\033[31m--jql cannot be evaluated with --offline\033[0m")
+                sys.exit(1)
             jql_parts.append(f"({args.jql})")
-        final_jql = " AND ".join(jql_parts) + " ORDER BY created DESC"
-        await jira.list_issues(jql=final_jql, max_results=args.max)
+            final_jql = " AND ".join(jql_parts) + " ORDER BY created DESC"
+            issues = []
+            async for issue in jira.list_issues(
+                jql=final_jql, max_results=args.max or None, page_size=args.page_size
+            ):
+                print_issue_line(issue)
+                cache.upsert(issue)
+                issues.append(issue)
+            cache.save()
+        else:
+            if not args.offline:
+                await jira.sync_cache(cache)
+            issues = cache.search(jira_type)[: args.max or None]
+            for issue in issues:
+                print_issue_line(issue)
+        print(f"\n\033[33m{len(issues)}\033[0m issues found")
     elif args.command == "get":
-        await jira.get_issue(issue_key=args.key)
+        cache = IssueCache.for_project(args.key.rsplit("-", 1)[0])
+        # Without a watermark a sync would pull the whole project; fetch the issue instead.
+        if not args.offline and cache.last_sync:
+            jira.project = args.key.rsplit("-", 1)[0]
+            await jira.sync_cache(cache)
+        issue = cache.get(args.key)
+        if issue is not None and (args.offline or cache.last_sync):
+            print_issue_details(issue, cache.subtasks(args.key))
+        elif args.offline:
+            logger.error(f"\033[31m{args.key} is not in the local cache\033[0m")
+            sys.exit(1)
+        else:
+            data = await jira.get_issue(issue_key=args.key)
+            cache.upsert(data)
+            for subtask in data["fields"].get("subtasks") or []:
+                subtask["fields"]["parent"] = {"key": args.key}
+                cache.upsert(subtask)
+            cache.save()
+    elif args.command == "sync":
+        jira.project = args.project or jira.project
+        cache = IssueCache.for_project(jira.project)
+        count = await jira.sync_cache(cache, full=args.full)
+        print(
+            f"\033[32m✓\033[0m Synced \033[33m{count}\033[0m issues "
+            f"({len(cache.issues)} cached, last update {cache.last_sync or '—'})"
+        )
     elif args.command == "comment":
         await jira.add_comment(issue_key=args.key, text=args.body)
     elif args.command == "transition":
         await jira.transition_issue(
             issue_key=args.key, transition_id=args.transition_id
         )
+    elif args.command == "bulk-create":
+        return await jira.bulk_create(load_issue_rows(args.file), args.concurrency)
+    elif args.command == "bulk-transition":
+        return await jira.bulk_transition(
+            args.keys, args.transition_id, args.concurrency
+        )
+    elif args.command == "bulk-comment":
+        return await jira.bulk_comment(args.keys, args.body, args.concurrency)
+    return 0
 
 
 if __name__ == "__main__":
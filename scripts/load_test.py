@@ -0,0 +1,702 @@
+"""Concurrent-session load test harness with a capacity report.
+
+Modes:
+  --base-url URL          load a running app; it must be configured to call the stand-in
+                          providers given by --stand-in-providers (checked before ramping)
+  --serve-providers       only run the stand-in provider server for the app to point at
+  (default)               harness self-test against an in-process stand-in pipeline; its
+                          numbers describe the harness, not the app
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import resource
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Protocol
+
+import httpx
+from pydantic import BaseModel, Field, ValidationError
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app.models.domain_models import Iteration, Session  # noqa: E402
+from app.models.request_models import (  # noqa: E402
+    CreateSessionRequest,
+    FeedbackRequest,
+    RunOptimizeRequest,
+)
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+ENDPOINTS = ("create_session", "feedback", "run_optimize")
+REQUEST_MODELS = {
+    "create_session": CreateSessionRequest,
+    "feedback": FeedbackRequest,
+    "run_optimize": RunOptimizeRequest,
+}
+
+# Median seconds and lognormal sigma per stand-in provider call.
+STAND_IN_LATENCIES = {
+    "chat": (1.5, 0.4),
+    "prompt_gen": (1.2, 0.4),
+    "revise": (1.5, 0.4),
+    "judge": (2.0, 0.5),
+    "image": (8.0, 0.6),
+}
+
+SYNTHETIC_GOALS = [
+    "a lighthouse on a storm-battered cliff at dusk",
+    "a red fox curled up in fresh snow, morning light",
+    "isometric cutaway of a cozy bookshop",
+    "portrait of an astronaut in a sunflower field",
+]
+SYNTHETIC_FEEDBACK = ["make it warmer", "tighter crop on the subject", "less saturated", ""]
+
+# One JSON object satisfying the prompt-gen, revise and judge output formats at once.
+STAND_IN_LLM_OUTPUT = {
+    "prompt": "## FLEX_BEGIN:subject\nstand-in subject\n## FLEX_END:subject",
+    "revised_prompt": "## FLEX_BEGIN:subject\nstand-in subject\n## FLEX_END:subject",
+    "negative_prompt": None,
+    "flex_blocks": {"subject": "stand-in subject"},
+    "changes_made": ["stand-in change"],
+    "preserved_elements": [],
+    "block_states": {"subject": "FLEX"},
+    "score": 70,
+    "notes": "stand-in judge notes",
+    "strong_points": [],
+    "weak_points": [],
+    "revision_recommendations": [],
+}
+# 1x1 transparent PNG.
+STAND_IN_PNG_B64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA"
+    "60e6kgAAAABJRU5ErkJggg=="
+)
+STAND_IN_STATS_PATH = "/_stand_in/stats"
+# Levels failing more requests than this are not a throughput measurement.
+MAX_ERROR_RATE = 0.5
+
+
+class Step(BaseModel):
+    endpoint: str = Field(description="One of ENDPOINTS")
+    body: dict = Field(default_factory=dict, description="Request body for the endpoint")
+
+
+class Target(Protocol):
+    async def send(self, step: Step, state: dict) -> None: ...
+
+    async def aclose(self) -> None: ...
+
+
+def stand_in_delay(rng: random.Random, name: str, latency_scale: float) -> float:
+    """Sample a stand-in provider latency in seconds."""
+    median, sigma = STAND_IN_LATENCIES[name]
+    return rng.lognormvariate(0, sigma) * median * latency_scale
+
+
+class StandInTarget:
+    """In-process stand-in pipeline used to self-test the harness.
+
+    It does not run the app, so its results are not a capacity number: `workers` caps
+    concurrently served requests and the saturation point it produces is that cap.
+    """
+
+    def __init__(self, latency_scale: float = 1.0, workers: int = 8, seed: int | None = None):
+        self.latency_scale = latency_scale
+        self.sessions: dict[str, Session] = {}
+        self._workers = asyncio.Semaphore(workers)
+        self._rng = random.Random(seed)
+
+    async def _provider_call(self, name: str) -> None:
+        await asyncio.sleep(stand_in_delay(self._rng, name, self.latency_scale))
+
+    async def send(self, step: Step, state: dict) -> None:
+        async with self._workers:
+            await self._handle(step, state)
+
+    async def _handle(self, step: Step, state: dict) -> None:
+        request = REQUEST_MODELS[step.endpoint].model_validate(step.body)
+        if isinstance(request, CreateSessionRequest):
+            await self._provider_call("prompt_gen")
+            session = Session(
+                session_id=str(uuid.uuid4()),
+                user_goal=request.user_goal,
+                image_provider=request.image_provider,
+                image_params=request.image_params,
+                max_iterations=request.max_iterations,
+                iterations=[Iteration(index=0, prompt_text=request.user_goal)],
+            )
+            self.sessions[session.session_id] = session
+            state["session_id"] = session.session_id
+            session.model_dump_json()
+            return
+
+        session = self.sessions[state["session_id"]]
+        if isinstance(request, FeedbackRequest):
+            session.iterations[-1].user_feedback = request.feedback_text
+        else:
+            for _ in range(request.max_iterations or session.max_iterations):
+                await self._provider_call("revise")
+                await self._provider_call("image")
+                await self._provider_call("judge")
+                previous = session.iterations[-1]
+                session.iterations.append(
+                    Iteration(
+                        index=previous.index + 1,
+                        prompt_text=previous.prompt_text,
+                        judge_score=self._rng.randint(40, 95),
+                    )
+                )
+        session.model_dump_json()
+
+    async def aclose(self) -> None:
+        self.sessions.clear()
+
+
+class HttpTarget:
+    """Drive a running sfumato app over its HTTP API."""
+
+    def __init__(self, base_url: str, timeout: float = 300.0):
+        self.client = httpx.AsyncClient(base_url=base_url.rstrip("/"), timeout=timeout)
+
+    async def send(self, step: Step, state: dict) -> None:
+        body = REQUEST_MODELS[step.endpoint].model_validate(step.body).model_dump()
+        if step.endpoint == "create_session":
+            response = await self.client.post("/api/sessions", json=body)
+        elif step.endpoint == "feedback":
+            response = await self.client.put(
+                f"/api/sessions/{state['session_id']}/feedback", json=body
+            )
+        else:
+            response = await self.client.post(
+                f"/api/sessions/{state['session_id']}/optimize/run", json=body
+            )
+        response.raise_for_status()
+        if step.endpoint == "create_session":
+            state["session_id"] = response.json()["session_id"]
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+class StandInProviderServer:
+    """Local HTTP server mimicking OpenRouter and image provider APIs with simulated latency.
+
+    Serves OpenAI-style chat completions (plain and streamed), OpenAI/xAI-style image
+    generations and Gemini-style generateContent, plus a request counter at
+    STAND_IN_STATS_PATH so the harness can check the app really calls it.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_scale: float = 1.0,
+        seed: int | None = None,
+    ):
+        self.host = host
+        self.port = port
+        self.latency_scale = latency_scale
+        self.requests = 0
+        self._rng = random.Random(seed)
+        self._server: asyncio.Server | None = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def start(self) -> str:
+        """Start listening and return the base URL."""
+        self._server = await asyncio.start_server(self._serve, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.base_url
+
+    async def aclose(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                raw = await reader.readexactly(int(headers.get("content-length", 0)))
+                body = json.loads(raw) if raw else {}
+                status, content_type, payload = await self._route(method, path, body)
+                writer.write(
+                    f"HTTP/1.1 {status} {'OK' if status == 200 else 'Not Found'}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(payload)}\r\n\r\n".encode()
+                    + payload
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, body: dict) -> tuple[int, str, bytes]:
+        path = path.split("?", 1)[0]
+        if method == "GET" and path == STAND_IN_STATS_PATH:
+            return 200, "application/json", json.dumps({"requests": self.requests}).encode()
+        if method != "POST":
+            return 404, "text/plain", b"not found"
+        if path.endswith("/chat/completions"):
+            self.requests += 1
+            await asyncio.sleep(stand_in_delay(self._rng, "chat", self.latency_scale))
+            content = json.dumps(STAND_IN_LLM_OUTPUT)
+            if body.get("stream"):
+                deltas = [content[i : i + 16] for i in range(0, len(content), 16)]
+                events = [
+                    "data: " + json.dumps({"choices": [{"delta": {"content": d}}]}) for d in deltas
+                ]
+                sse = "\n\n".join([*events, "data: [DONE]"]) + "\n\n"
+                return 200, "text/event-stream", sse.encode()
+            message = {"role": "assistant", "content": content}
+            return 200, "application/json", json.dumps({"choices": [{"message": message}]}).encode()
+        if path.endswith("/images/generations"):
+            self.requests += 1
+            await asyncio.sleep(stand_in_delay(self._rng, "image", self.latency_scale))
+            data = {"created": int(time.time()), "data": [{"b64_json": STAND_IN_PNG_B64}]}
+            return 200, "application/json", json.dumps(data).encode()
+        if path.endswith(":generateContent"):
+            self.requests += 1
+            await asyncio.sleep(stand_in_delay(self._rng, "image", self.latency_scale))
+            part = {"inlineData": {"mimeType": "image/png", "data": STAND_IN_PNG_B64}}
+            data = {"candidates": [{"content": {"parts": [part]}}]}
+            return 200, "application/json", json.dumps(data).encode()
+        return 404, "text/plain", b"not found"
+
+
+class ProcessSampler:
+    """CPU and RSS readings for a process, from /proc when available."""
+
+    def __init__(self, pid: int | None = None):
+        self.pid = pid or os.getpid()
+        self._clock_ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+    def cpu_seconds(self) -> float:
+        """Return user + system CPU seconds consumed so far."""
+        stat = Path(f"/proc/{self.pid}/stat")
+        if stat.exists():
+            fields = stat.read_text().rsplit(")", 1)[1].split()
+            return (int(fields[11]) + int(fields[12])) / self._clock_ticks
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        return usage.ru_utime + usage.ru_stime
+
+    def rss_mb(self) -> float:
+        """Return the current resident set size in MB (peak RSS off Linux)."""
+        status = Path(f"/proc/{self.pid}/status")
+        if status.exists():
+            for line in status.read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+class LevelResult(BaseModel):
+    concurrency: int = Field(description="Number of concurrent virtual users")
+    duration: float = Field(description="Wall-clock seconds the level ran for")
+    latencies: dict[str, list[float]] = Field(
+        default_factory=dict, description="Successful request latencies per endpoint"
+    )
+    errors: dict[str, int] = Field(default_factory=dict, description="Failed requests per endpoint")
+    flows_completed: int = Field(default=0, description="Session flows finished without error")
+    cpu_percent: float | None = Field(
+        default=None, description="Sampled process CPU over the level, if sampled"
+    )
+    rss_mb: float | None = Field(
+        default=None, description="Sampled process RSS at the end of the level, if sampled"
+    )
+    loop_lag: list[float] = Field(
+        default_factory=list,
+        description="Load generator event-loop lag samples in seconds (harness health)",
+    )
+
+    @property
+    def throughput(self) -> float:
+        """Completed session flows per second."""
+        return self.flows_completed / self.duration if self.duration else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        """Share of requests that failed."""
+        errors = sum(self.errors.values())
+        total = errors + sum(len(values) for values in self.latencies.values())
+        return errors / total if total else 0.0
+
+    @property
+    def healthy(self) -> bool:
+        """Whether the level completed flows and most of its requests succeeded."""
+        return self.flows_completed > 0 and self.error_rate <= MAX_ERROR_RATE
+
+    def summary(self) -> dict:
+        """Return a JSON-serializable summary of this level."""
+        return {
+            "concurrency": self.concurrency,
+            "throughput": round(self.throughput, 3),
+            "flows_completed": self.flows_completed,
+            "error_rate": round(self.error_rate, 3),
+            "healthy": self.healthy,
+            "cpu_percent": None if self.cpu_percent is None else round(self.cpu_percent, 1),
+            "rss_mb": None if self.rss_mb is None else round(self.rss_mb, 1),
+            "generator_loop_lag_p95_ms": round(percentile(self.loop_lag, 0.95) * 1000, 1),
+            "endpoints": {
+                name: {
+                    "count": len(values),
+                    "errors": self.errors.get(name, 0),
+                    "p50": round(percentile(values, 0.50), 3),
+                    "p95": round(percentile(values, 0.95), 3),
+                    "p99": round(percentile(values, 0.99), 3),
+                }
+                for name, values in self.latencies.items()
+            },
+        }
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Nearest-rank percentile, 0.0 for an empty list."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))]
+
+
+def synthetic_flow(rng: random.Random) -> list[Step]:
+    """Build one create -> feedback -> optimize session flow."""
+    return [
+        Step(
+            endpoint="create_session",
+            body={
+                "user_goal": rng.choice(SYNTHETIC_GOALS),
+                "image_provider": rng.choice(["openai", "grok", "nano_banana"]),
+                "max_iterations": 3,
+            },
+        ),
+        Step(endpoint="feedback", body={"feedback_text": rng.choice(SYNTHETIC_FEEDBACK)}),
+        Step(endpoint="run_optimize", body={"max_iterations": rng.randint(1, 3)}),
+    ]
+
+
+def load_flows(path: Path) -> list[list[Step]]:
+    """Load recorded traffic: JSONL of {"endpoint", "body"}; each create_session starts a flow."""
+    flows: list[list[Step]] = []
+    for line_no, line in enumerate(path.read_text().splitlines(), start=1):
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        step = Step.model_validate(record)
+        if step.endpoint not in ENDPOINTS:
+            raise ValueError(f"{path}:{line_no}: unknown endpoint {step.endpoint!r}")
+        try:
+            REQUEST_MODELS[step.endpoint].model_validate(step.body)
+        except ValidationError as e:
+            raise ValueError(f"{path}:{line_no}: invalid {step.endpoint} body: {e}") from e
+        if step.endpoint == "create_session":
+            flows.append([])
+        elif not flows:
+            raise ValueError(f"{path}:{line_no}: {step.endpoint} before any create_session")
+        flows[-1].append(step)
+    return flows
+
+
+async def _probe_loop_lag(lag: list[float], interval: float, stop: asyncio.Event) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        started = loop.time()
+        await asyncio.sleep(interval)
+        lag.append(max(0.0, loop.time() - started - interval))
+
+
+async def run_level(
+    target: Target,
+    concurrency: int,
+    duration: float,
+    flows: list[list[Step]] | None,
+    sampler: ProcessSampler | None,
+    seed: int,
+) -> LevelResult:
+    """Run `concurrency` virtual users looping over session flows for `duration` seconds."""
+    result = LevelResult(concurrency=concurrency, duration=duration)
+    result.latencies = {name: [] for name in ENDPOINTS}
+    stop = asyncio.Event()
+    deadline = time.perf_counter() + duration
+
+    async def user(user_id: int) -> None:
+        rng = random.Random(seed + user_id)
+        flow_index = user_id
+        while time.perf_counter() < deadline:
+            if flows:
+                flow = flows[flow_index % len(flows)]
+                flow_index += concurrency
+            else:
+                flow = synthetic_flow(rng)
+            state: dict = {}
+            for step in flow:
+                started = time.perf_counter()
+                try:
+                    await target.send(step, state)
+                except Exception as e:
+                    result.errors[step.endpoint] = result.errors.get(step.endpoint, 0) + 1
+                    logger.debug(f"{step.endpoint} failed: {e}")
+                    break
+                result.latencies[step.endpoint].append(time.perf_counter() - started)
+            else:
+                result.flows_completed += 1
+
+    cpu_start = sampler.cpu_seconds() if sampler else 0.0
+    wall_start = time.perf_counter()
+    probe = asyncio.create_task(_probe_loop_lag(result.loop_lag, 0.05, stop))
+    await asyncio.gather(*(user(i) for i in range(concurrency)))
+    stop.set()
+    await probe
+    wall = time.perf_counter() - wall_start
+    result.duration = wall
+    if sampler is not None:
+        result.cpu_percent = 100 * (sampler.cpu_seconds() - cpu_start) / wall if wall else 0.0
+        result.rss_mb = sampler.rss_mb()
+    return result
+
+
+async def check_stand_in_used(
+    target: Target, providers_url: str, flow: list[Step], timeout: float = 10.0
+) -> bool:
+    """Run one flow and report whether the app sent any calls to the stand-in providers."""
+    async with httpx.AsyncClient(base_url=providers_url, timeout=timeout) as client:
+        before = (await client.get(STAND_IN_STATS_PATH)).json()["requests"]
+        state: dict = {}
+        for step in flow:
+            await target.send(step, state)
+        after = (await client.get(STAND_IN_STATS_PATH)).json()["requests"]
+    return after > before
+
+
+def find_saturation(results: list[LevelResult], min_gain: float) -> LevelResult | None:
+    """Return the last level before added concurrency stops buying `min_gain` throughput.
+
+    Returns None while throughput still grows, or if any level was unhealthy: a level with
+    no completed flows or mostly errors measures failures, not capacity.
+    """
+    if not all(level.healthy for level in results):
+        return None
+    best: LevelResult | None = None
+    for level in results:
+        if best is None or level.throughput > best.throughput * (1 + min_gain):
+            best = level
+        elif level.concurrency > best.concurrency:
+            return best
+    return None
+
+
+def print_report(
+    results: list[LevelResult], saturation: LevelResult | None, self_test: bool
+) -> None:
+    """Print a per-level table and the saturation point."""
+
+    def fmt(value: float | None, width: int) -> str:
+        return f"{'n/a':>{width}}" if value is None else f"{value:>{width}.1f}"
+
+    print(
+        f"\n{'users':>6} {'flows/s':>8} {'cpu%':>6} {'rss MB':>8} {'gen lag':>8}  "
+        + "  ".join(f"{name + ' p50/p95':>24}" for name in ENDPOINTS)
+        + "  errors"
+    )
+    for level in results:
+        summary = level.summary()
+        endpoints = "  ".join(
+            f"{summary['endpoints'][name]['p50']:>11.3f}/{summary['endpoints'][name]['p95']:<12.3f}"
+            for name in ENDPOINTS
+        )
+        errors = sum(level.errors.values())
+        print(
+            f"{level.concurrency:>6} {level.throughput:>8.3f} {fmt(level.cpu_percent, 6)} "
+            f"{fmt(level.rss_mb, 8)} {summary['generator_loop_lag_p95_ms']:>6.1f}ms  "
+            f"{endpoints}  " + (f"\033[31m{errors}\033[0m" if errors else "0")
+        )
+    unhealthy = [level for level in results if not level.healthy]
+    if unhealthy:
+        first = unhealthy[0]
+        print(
+            f"\n\033[31m✗ {first.concurrency} concurrent sessions completed "
+            f"{first.flows_completed} flows with {first.error_rate:.0%} errors\033[0m — "
+            "no saturation point reported; check the target and the logged errors."
+        )
+        return
+    if self_test:
+        print(
+            "\n\033[33mHarness self-test:\033[0m the knee reflects --workers and cpu/rss are "
+            "the harness process. This is not a capacity number; use --base-url."
+        )
+        if saturation is not None:
+            print(f"  Self-test knee at {saturation.concurrency} concurrent sessions")
+        return
+    if saturation is None:
+        print("\n\033[33mNo saturation reached\033[0m — raise --max-concurrency.")
+    else:
+        print(
+            f"\n\033[32m✓\033[0m Saturation at \033[36m{saturation.concurrency}\033[0m "
+            f"concurrent sessions ({saturation.throughput:.3f} flows/s)"
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build CLI argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Load test sfumato optimize sessions and report capacity",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""Examples:
+  python scripts/load_test.py --serve-providers --providers-port 8099
+  python scripts/load_test.py --base-url http://localhost:5000 --pid 12345 \\
+      --stand-in-providers http://127.0.0.1:8099 --report capacity.json
+  python scripts/load_test.py --latency-scale 0.01  # harness self-test
+""",
+    )
+    parser.add_argument("--base-url", default=None, help="Target a running app over HTTP")
+    parser.add_argument(
+        "--stand-in-providers",
+        default=None,
+        help="Stand-in provider URL the app is configured to use (required with --base-url)",
+    )
+    parser.add_argument(
+        "--pid", type=int, default=None, help="App process to sample CPU/RSS from (HTTP mode)"
+    )
+    parser.add_argument(
+        "--serve-providers",
+        action="store_true",
+        help="Only run the stand-in provider server for the app to point at",
+    )
+    parser.add_argument(
+        "--providers-port", type=int, default=8099, help="Port for --serve-providers"
+    )
+    parser.add_argument(
+        "--replay", type=Path, default=None, help="Recorded JSONL traffic instead of synthetic"
+    )
+    parser.add_argument(
+        "--latency-scale",
+        type=float,
+        default=1.0,
+        help="Multiplier on stand-in provider latencies",
+    )
+    parser.add_argument("--workers", type=int, default=8, help="Stand-in request worker pool size")
+    parser.add_argument("--start-concurrency", type=int, default=1, help="First ramp level")
+    parser.add_argument("--max-concurrency", type=int, default=64, help="Last ramp level")
+    parser.add_argument(
+        "--ramp-factor", type=float, default=2.0, help="Concurrency multiplier per level"
+    )
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds per level")
+    parser.add_argument(
+        "--min-gain",
+        type=float,
+        default=0.1,
+        help="Throughput gain below which a level counts as saturated",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--report", type=Path, default=None, help="Write JSON report here")
+    return parser
+
+
+async def serve_providers(port: int, latency_scale: float, seed: int) -> None:
+    """Run the stand-in provider server until interrupted."""
+    server = StandInProviderServer(port=port, latency_scale=latency_scale, seed=seed)
+    url = await server.start()
+    print(f"Stand-in providers on \033[36m{url}\033[0m. Start the app with:")
+    print(f"  OPENROUTER_BASE_URL={url}")
+    print(f"  OPENAI_IMAGE_BASE_URL={url}")
+    print(f"  GROK_IMAGE_BASE_URL={url}")
+    print(f"  NANO_BANANA_BASE_URL={url}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.aclose()
+
+
+async def main() -> None:
+    """CLI entry point."""
+    args = build_parser().parse_args()
+    if args.serve_providers:
+        await serve_providers(args.providers_port, args.latency_scale, args.seed)
+        return
+
+    try:
+        flows = load_flows(args.replay) if args.replay else None
+    except ValueError as e:
+        logger.error(f"\033[31m{e}\033[0m")
+        sys.exit(1)
+    self_test = args.base_url is None
+    if self_test:
+        target: Target = StandInTarget(
+            latency_scale=args.latency_scale, workers=args.workers, seed=args.seed
+        )
+        sampler: ProcessSampler | None = ProcessSampler()
+    else:
+        if not args.stand_in_providers:
+            logger.error(
+                "\033[31m--base-url needs --stand-in-providers: start them with "
+                "--serve-providers and point the app at them, so no paid calls are made\033[0m"
+            )
+            sys.exit(1)
+        target = HttpTarget(args.base_url)
+        sampler = ProcessSampler(args.pid) if args.pid else None
+        flow = flows[0] if flows else synthetic_flow(random.Random(args.seed))
+        try:
+            used = await check_stand_in_used(target, args.stand_in_providers, flow)
+        except httpx.HTTPError as e:
+            await target.aclose()
+            logger.error(f"\033[31mStand-in check failed: {e}\033[0m")
+            sys.exit(1)
+        if not used:
+            await target.aclose()
+            logger.error(
+                f"\033[31mThe app made no calls to {args.stand_in_providers}; "
+                "it may be using real providers. Aborting.\033[0m"
+            )
+            sys.exit(1)
+
+    results: list[LevelResult] = []
+    concurrency = args.start_concurrency
+    try:
+        while concurrency <= args.max_concurrency:
+            print(f"Running \033[36m{concurrency}\033[0m concurrent sessions...")
+            level = await run_level(target, concurrency, args.duration, flows, sampler, args.seed)
+            results.append(level)
+            if not level.healthy or find_saturation(results, args.min_gain) is not None:
+                break
+            concurrency = max(concurrency + 1, int(concurrency * args.ramp_factor))
+    finally:
+        await target.aclose()
+
+    saturation = find_saturation(results, args.min_gain)
+    print_report(results, saturation, self_test)
+    if args.report:
+        report: dict = {
+            "mode": "self-test" if self_test else "http",
+            "target": args.base_url or "stand-in",
+            "levels": [level.summary() for level in results],
+        }
+        if not self_test:
+            report["saturation_concurrency"] = saturation.concurrency if saturation else None
+            report["saturation_throughput"] = (
+                round(saturation.throughput, 3) if saturation else None
+            )
+        args.report.write_text(json.dumps(report, indent=2))
+        print(f"  Report written to \033[34m{args.report}\033[0m")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,148 @@
+import asyncio
+
+import pytest
+
+from app.tools.hedge_tool import HedgePolicy, HedgeTool, LatencyStats
+
+
+@pytest.fixture
+def tool() -> HedgeTool:
+    hedge_tool = HedgeTool(policy=HedgePolicy(enabled=True, min_samples=3, max_hedge_rate=1.0))
+    for provider in ("openai", "grok"):
+        for _ in range(5):
+            hedge_tool.stats.record(provider, 0.01)
+    return hedge_tool
+
+
+class TestLatencyStats:
+    def test_percentile(self):
+        stats = LatencyStats(window=10)
+        for value in range(1, 11):
+            stats.record("openai", value / 10)
+        assert stats.percentile("openai", 0.5) == 0.5
+        assert stats.percentile("openai", 0.9) == 0.9
+        assert stats.percentile("grok", 0.5) is None
+
+    def test_window_is_rolling(self):
+        stats = LatencyStats(window=3)
+        for value in (10.0, 1.0, 1.0, 1.0):
+            stats.record("openai", value)
+        assert stats.count("openai") == 3
+        assert stats.percentile("openai", 0.99) == 1.0
+
+
+class TestHedgePolicy:
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("HEDGE_ENABLED", "true")
+        monkeypatch.setenv("HEDGE_FALLBACKS", "openai:grok, grok:openai")
+        policy = HedgePolicy.from_env()
+        assert policy.enabled
+        assert policy.fallbacks == {"openai": "grok", "grok": "openai"}
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("HEDGE_ENABLED", raising=False)
+        assert not HedgePolicy.from_env().enabled
+
+
+class TestHedgeTool:
+    async def test_fast_call_is_not_hedged(self, tool):
+        calls = []
+
+        async def make_call(provider: str) -> str:
+            calls.append(provider)
+            return provider
+
+        assert await tool.call("openai", make_call) == "openai"
+        assert calls == ["openai"]
+        assert tool.hedge_rate == 0.0
+
+    async def test_slow_call_hedged_to_fallback_and_loser_cancelled(self, tool):
+        tool.policy.fallbacks = {"openai": "grok"}
+        cancelled = []
+
+        async def make_call(provider: str) -> str:
+            try:
+                await asyncio.sleep(1.0 if provider == "openai" else 0.0)
+            except asyncio.CancelledError:
+                cancelled.append(provider)
+                raise
+            return provider
+
+        assert await tool.call("openai", make_call) == "grok"
+        await asyncio.sleep(0)
+        assert cancelled == ["openai"]
+        assert tool.hedge_rate == 1.0
+        # The losing primary counts as at least its elapsed time, not its partial run.
+        assert tool.stats.percentile("openai", 0.99) >= 0.01
+
+    async def test_hedge_failure_falls_back_to_primary(self, tool):
+        tool.policy.fallbacks = {"openai": "grok"}
+
+        async def make_call(provider: str) -> str:
+            if provider == "grok":
+                raise RuntimeError("grok down")
+            await asyncio.sleep(0.05)
+            return provider
+
+        assert await tool.call("openai", make_call) == "openai"
+
+    async def test_both_failing_raises_primary_error(self, tool):
+
+        async def make_call(provider: str) -> str:
+            await asyncio.sleep(0.05)
+            raise RuntimeError(provider)
+
+        with pytest.raises(RuntimeError, match="openai"):
+            await tool.call("openai", make_call)
+
+    async def test_hedge_rate_budget(self, tool):
+        tool.policy.max_hedge_rate = 0.5
+        tool._recent_hedges.extend([True, False])
+        assert tool.hedge_delay("openai") is None
+
+    async def test_no_hedge_without_enough_samples(self, tool):
+        tool.policy.min_samples = 50
+        assert tool.hedge_delay("openai") is None
+
+    async def test_budget_rechecked_before_each_hedge(self, tool):
+        tool.policy.max_hedge_rate = 0.1
+        launched = []
+
+        async def make_call(provider: str) -> str:
+            launched.append(provider)
+            await asyncio.sleep(0.1)
+            return provider
+
+        results = await asyncio.gather(*(tool.call("openai", make_call) for _ in range(20)))
+        assert results == ["openai"] * 20
+        hedges = len(launched) - 20
+        assert 1 <= hedges <= 20 * 0.1
+        assert tool.hedge_rate <= 0.1
+
+    async def test_caller_cancellation_cancels_primary(self, tool):
+        finished = []
+
+        async def make_call(provider: str) -> str:
+            await asyncio.sleep(0.1)
+            finished.append(provider)
+            return provider
+
+        caller = asyncio.create_task(tool.call("openai", make_call))
+        await asyncio.sleep(0.001)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        await asyncio.sleep(0.15)
+        assert finished == []
+
+    async def test_cancelled_hedge_not_recorded(self, tool):
+        tool.policy.fallbacks = {"openai": "grok"}
+        grok_samples = tool.stats.count("grok")
+
+        async def make_call(provider: str) -> str:
+            await asyncio.sleep(0.03 if provider == "openai" else 1.0)
+            return provider
+
+        assert await tool.call("openai", make_call) == "openai"
+        await asyncio.sleep(0)
+        assert tool.stats.count("grok") == grok_samples
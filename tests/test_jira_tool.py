@@ -0,0 +1,269 @@
+import importlib.util
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "jira_tool.py"
+_spec = importlib.util.spec_from_file_location("jira_tool", SCRIPT)
+jira_tool = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(jira_tool)
+
+
+class StandInJira:
+    """In-memory stand-in for the JIRA REST endpoints used by JiraTool."""
+
+    def __init__(self, issue_count: int = 0, rate_limited: int = 0, unreachable: int = 0):
+        self.issues = [
+            {
+                "key": f"SFU-{i}",
+                "fields": {
+                    "summary": f"Issue {i}",
+                    "status": {"name": "Open"},
+                    "issuetype": {"name": "Задача"},
+                },
+            }
+            for i in range(1, issue_count + 1)
+        ]
+        self.rate_limited = rate_limited
+        self.unreachable = unreachable
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.unreachable:
+            self.unreachable -= 1
+            raise httpx.ConnectError("connection refused", request=request)
+        if self.rate_limited:
+            self.rate_limited -= 1
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        path = request.url.path
+        if "SFU-500" in path:
+            raise httpx.ReadError("connection reset", request=request)
+        if path.endswith("/search/jql"):
+            size = int(request.url.params["maxResults"])
+            start = int(request.url.params.get("nextPageToken", 0))
+            page = self.issues[start : start + size]
+            body: dict = {"issues": page, "isLast": start + size >= len(self.issues)}
+            if not body["isLast"]:
+                body["nextPageToken"] = str(start + size)
+            return httpx.Response(200, json=body)
+        if path.endswith("/transitions"):
+            if "SFU-404" in path:
+                return httpx.Response(404, text="Issue does not exist")
+            return httpx.Response(204)
+        if path.endswith("/comment"):
+            return httpx.Response(201, json={})
+        if request.method == "GET" and "/issue/" in path:
+            key = path.rsplit("/", 1)[1]
+            issue = next((i for i in self.issues if i["key"] == key), None)
+            if issue is None:
+                return httpx.Response(404, text="Issue does not exist")
+            subtasks = [
+                {"key": i["key"], "fields": {**i["fields"], "parent": None}}
+                for i in self.issues
+                if (i["fields"].get("parent") or {}).get("key") == key
+            ]
+            return httpx.Response(
+                200, json={"key": key, "fields": {**issue["fields"], "subtasks": subtasks}}
+            )
+        if path.endswith("/issue"):
+            fields = json.loads(request.content)["fields"]
+            return httpx.Response(201, json={"key": f"SFU-{100 + len(self.requests)}", **fields})
+        return httpx.Response(404, text="not found")
+
+
+def make_jira(server: StandInJira):
+    return jira_tool.JiraTool(
+        host="jira.test",
+        email="me@test",
+        api_token="token",
+        transport=httpx.MockTransport(server),
+    )
+
+
+class TestListIssues:
+    async def test_follows_page_tokens(self):
+        server = StandInJira(issue_count=25)
+        async with make_jira(server) as jira:
+            keys = [i["key"] async for i in jira.list_issues("project = SFU", None, 10)]
+        assert keys == [f"SFU-{i}" for i in range(1, 26)]
+        assert len(server.requests) == 3
+
+    async def test_stops_at_max_results(self):
+        server = StandInJira(issue_count=25)
+        async with make_jira(server) as jira:
+            keys = [i["key"] async for i in jira.list_issues("project = SFU", 12, 10)]
+        assert len(keys) == 12
+        assert len(server.requests) == 2
+
+    async def test_search_error_raises(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(400, text="bad jql")
+
+        jira = make_jira(handler)
+        with pytest.raises(jira_tool.JiraError, match="Search failed \\(400\\)"):
+            async for _ in jira.list_issues("project = ???"):
+                pass
+        await jira.aclose()
+
+
+class TestRetries:
+    async def test_retry_after_honored(self):
+        server = StandInJira(rate_limited=2)
+        async with make_jira(server) as jira:
+            await jira.add_comment("SFU-1", "hi")
+        assert len(server.requests) == 3
+
+    def test_retry_after_http_date(self):
+        response = httpx.Response(
+            429,
+            headers={
+                "Retry-After": "Wed, 21 Oct 2026 07:28:05 GMT",
+                "Date": "Wed, 21 Oct 2026 07:28:00 GMT",
+            },
+        )
+        assert jira_tool._retry_after(response) == 5.0
+
+    async def test_connect_error_retried(self, monkeypatch):
+        monkeypatch.setattr(jira_tool, "RETRY_BASE_DELAY", 0)
+        server = StandInJira(unreachable=2)
+        async with make_jira(server) as jira:
+            await jira.add_comment("SFU-1", "hi")
+        assert len(server.requests) == 3
+
+    async def test_pool_timeout_retried_for_post(self, monkeypatch):
+        monkeypatch.setattr(jira_tool, "RETRY_BASE_DELAY", 0)
+        server = StandInJira()
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            if len(attempts) == 1:
+                raise httpx.PoolTimeout("no free connection", request=request)
+            return server(request)
+
+        async with make_jira(handler) as jira:
+            await jira.add_comment("SFU-1", "hi")
+        assert len(attempts) == 2
+        assert len(server.requests) == 1
+
+    async def test_read_error_not_retried_for_post(self, monkeypatch):
+        monkeypatch.setattr(jira_tool, "RETRY_BASE_DELAY", 0)
+        server = StandInJira()
+        async with make_jira(server) as jira:
+            with pytest.raises(httpx.ReadError):
+                await jira.add_comment("SFU-500", "hi")
+        assert len(server.requests) == 1
+
+
+class TestBulk:
+    async def test_bulk_transition_reports_failures(self):
+        server = StandInJira()
+        async with make_jira(server) as jira:
+            failed = await jira.bulk_transition(["SFU-1", "SFU-404", "SFU-3"], "41", 2)
+        assert failed == 1
+        assert len(server.requests) == 3
+
+    async def test_bulk_counts_transport_errors(self, monkeypatch, capsys):
+        monkeypatch.setattr(jira_tool, "RETRY_BASE_DELAY", 0)
+        server = StandInJira()
+        async with make_jira(server) as jira:
+            failed = await jira.bulk_comment(["SFU-1", "SFU-500", "SFU-3"], "hi", 2)
+        assert failed == 1
+        assert "2/3" in capsys.readouterr().out
+
+    def test_json_rows_normalize_ac(self, tmp_path):
+        path = tmp_path / "issues.json"
+        path.write_text(
+            json.dumps(
+                [
+                    {"type": "story", "summary": "A", "ac": "Tests pass| Docs updated"},
+                    {"type": "story", "summary": "B", "ac": ["One", " "]},
+                    {"type": "task", "summary": "C"},
+                ]
+            ),
+            encoding="utf-8",
+        )
+        rows = jira_tool.load_issue_rows(path)
+        assert [row["ac"] for row in rows] == [["Tests pass", "Docs updated"], ["One"], []]
+
+    async def test_bulk_create_from_csv(self, tmp_path):
+        path = tmp_path / "issues.csv"
+        path.write_text(
+            "type,summary,parent,ac\nstory,First,SFU-1,Tests pass|Docs updated\ntask,Second,,\n",
+            encoding="utf-8",
+        )
+        rows = jira_tool.load_issue_rows(path)
+        assert rows[0]["ac"] == ["Tests pass", "Docs updated"]
+        server = StandInJira()
+        async with make_jira(server) as jira:
+            assert await jira.bulk_create(rows) == 0
+        sent = [json.loads(r.content)["fields"] for r in server.requests]
+        assert {f["summary"] for f in sent} == {"First", "Second"}
+        assert next(f for f in sent if f["summary"] == "First")["parent"] == {"key": "SFU-1"}
+
+
+class TestIssueCache:
+    def make_server(self) -> StandInJira:
+        server = StandInJira(issue_count=3)
+        for i, issue in enumerate(server.issues, start=1):
+            issue["fields"]["updated"] = f"2026-10-1{i}T09:30:00.000+0000"
+        server.issues[2]["fields"]["parent"] = {"key": "SFU-1"}
+        server.issues[2]["fields"]["issuetype"] = {"name": "Подзадача", "subtask": True}
+        return server
+
+    async def test_incremental_sync(self, tmp_path):
+        server = self.make_server()
+        cache = jira_tool.IssueCache(tmp_path / "SFU.json")
+        async with make_jira(server) as jira:
+            assert await jira.sync_cache(cache) == 3
+            assert cache.last_sync == "2026-10-13 09:30"
+            await jira.sync_cache(cache)
+        first_jql = server.requests[0].url.params["jql"]
+        second_jql = server.requests[1].url.params["jql"]
+        assert "updated >=" not in first_jql
+        assert 'updated >= "2026-10-12 09:30"' in second_jql
+
+        reloaded = jira_tool.IssueCache(tmp_path / "SFU.json")
+        assert set(reloaded.issues) == {"SFU-1", "SFU-2", "SFU-3"}
+        assert [st["key"] for st in reloaded.subtasks("SFU-1")] == ["SFU-3"]
+
+    async def test_watermark_converts_offset_to_utc(self, tmp_path):
+        server = self.make_server()
+        server.issues[0]["fields"]["updated"] = "2026-10-14T01:30:00.000-0700"
+        cache = jira_tool.IssueCache(tmp_path / "SFU.json")
+        async with make_jira(server) as jira:
+            await jira.sync_cache(cache)
+            assert cache.last_sync == "2026-10-14 08:30"
+            await jira.sync_cache(cache)
+        # Queried a day back, so a profile timezone behind UTC cannot skip updates.
+        assert 'updated >= "2026-10-13 08:30"' in server.requests[1].url.params["jql"]
+
+    async def test_offline_get_uses_cache_only(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv("JIRA_CACHE_DIR", str(tmp_path))
+        server = self.make_server()
+        async with make_jira(server) as jira:
+            await jira.sync_cache(jira_tool.IssueCache.for_project("SFU"))
+            sent = len(server.requests)
+            args = jira_tool.build_parser().parse_args(["get", "SFU-1", "--offline"])
+            await jira_tool.run_command(jira, args)
+        assert len(server.requests) == sent
+        out = capsys.readouterr().out
+        assert "Issue 1" in out
+        assert "SFU-3" in out
+
+    async def test_cold_get_fetches_single_issue(self, tmp_path, monkeypatch, capsys):
+        monkeypatch.setenv("JIRA_CACHE_DIR", str(tmp_path))
+        server = self.make_server()
+        async with make_jira(server) as jira:
+            args = jira_tool.build_parser().parse_args(["get", "SFU-1"])
+            await jira_tool.run_command(jira, args)
+        assert [r.url.path for r in server.requests] == ["/rest/api/3/issue/SFU-1"]
+        assert "Issue 1" in capsys.readouterr().out
+
+        cache = jira_tool.IssueCache.for_project("SFU")
+        assert cache.last_sync is None
+        assert cache.get("SFU-1")["fields"]["summary"] == "Issue 1"
+        assert [st["key"] for st in cache.subtasks("SFU-1")] == ["SFU-3"]
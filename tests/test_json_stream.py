@@ -0,0 +1,120 @@
+import asyncio
+import json
+import time
+
+import httpx
+import pytest
+
+from app.tools.hedge_tool import HedgePolicy, HedgeTool
+from app.tools.openrouter_tool import OpenRouterTool
+from app.utils.json_stream_utils import JsonFieldStream, iter_json_fields, parse_llm_json
+
+REVISION = {
+    "revised_prompt": 'A "quoted" lighthouse, {braces} and [brackets]\nkept in text',
+    "negative_prompt": None,
+    "changes_made": ["warmer light", "tighter crop"],
+    "preserved_elements": [],
+    "block_states": {"subject": "FROZEN", "lighting": {"nested": ["REVISE"]}},
+    "score": 87,
+    "ratio": -1.5e2,
+    "final": True,
+}
+
+
+def sse_body(payload: str) -> str:
+    lines = [": OPENROUTER PROCESSING", ""]
+    for i in range(0, len(payload), 5):
+        delta = {"choices": [{"delta": {"content": payload[i : i + 5]}}]}
+        lines += [f"data: {json.dumps(delta)}", ""]
+    lines += ["data: [DONE]", ""]
+    return "\n".join(lines)
+
+
+async def chunked(text: str, size: int = 7):
+    for i in range(0, len(text), size):
+        yield text[i : i + size]
+
+
+async def collect(text: str) -> list:
+    return [field async for field in iter_json_fields(chunked(text))]
+
+
+class TestJsonFieldStream:
+    def test_emits_field_as_soon_as_it_closes(self):
+        parser = JsonFieldStream()
+        assert parser.feed('{"revised_prompt": "a cat') == []
+        assert parser.feed(' on a mat", "changes') == [("revised_prompt", "a cat on a mat")]
+        assert parser.feed('_made": ["x"]') == [("changes_made", ["x"])]
+
+    def test_scalar_emitted_on_separator(self):
+        parser = JsonFieldStream()
+        assert parser.feed('{"score": 42') == []
+        assert parser.feed(", ") == [("score", 42)]
+
+    async def test_all_value_types_in_order(self):
+        fields = await collect(json.dumps(REVISION, indent=2))
+        assert fields == list(REVISION.items())
+
+    async def test_markdown_fences_skipped(self):
+        text = "```json\n" + json.dumps({"score": 71, "notes": "ok"}) + "\n```"
+        assert await collect(text) == [("score", 71), ("notes", "ok")]
+
+    async def test_malformed_stream_falls_back_to_full_parse(self):
+        text = 'Using {FLEX} markers:\n{"score": 55, "notes": "ok"}'
+        assert await collect(text) == [("score", 55), ("notes", "ok")]
+
+    async def test_unrecoverable_stream_raises(self):
+        with pytest.raises(ValueError):
+            await collect('{"score": 55, \'notes\': "single quotes"}')
+        with pytest.raises(ValueError):
+            await collect('{"score": 55, "notes": "cut of')
+
+    def test_parse_llm_json_with_prose(self):
+        assert parse_llm_json('Here you go:\n{"score": 1}\nThanks') == {"score": 1}
+
+
+class TestOpenRouterStreaming:
+    async def test_stream_json_fields(self):
+        payload = json.dumps({"revised_prompt": "a fox", "changes_made": ["added fox"]})
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert json.loads(request.content)["stream"] is True
+            return httpx.Response(200, text=sse_body(payload))
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with OpenRouterTool(api_key="k", base_url="http://test", client=client) as tool:
+            messages = [{"role": "user", "content": "x"}]
+            fields = [f async for f in tool.stream_json_fields(messages)]
+        assert fields == [("revised_prompt", "a fox"), ("changes_made", ["added fox"])]
+        assert client.is_closed
+
+    async def test_slow_stream_is_hedged(self):
+        payload = json.dumps({"score": 80, "notes": "ok"})
+        requests = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if len(requests) == 1:
+                await asyncio.sleep(1.0)
+            return httpx.Response(200, text=sse_body(payload))
+
+        hedge = HedgeTool(policy=HedgePolicy(enabled=True, min_samples=1, max_hedge_rate=1.0))
+        hedge.stats.record("openrouter", 0.01)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        started = time.perf_counter()
+        async with OpenRouterTool(
+            api_key="k", base_url="http://test", client=client, hedge=hedge
+        ) as tool:
+            fields = [f async for f in tool.stream_json_fields([])]
+        assert fields == [("score", 80), ("notes", "ok")]
+        assert len(requests) == 2
+        assert time.perf_counter() - started < 0.5
+
+    async def test_http_error(self):
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda r: httpx.Response(429, text="slow down"))
+        )
+        tool = OpenRouterTool(api_key="k", base_url="http://test", client=client)
+        with pytest.raises(httpx.HTTPStatusError, match="429"):
+            async for _ in tool.stream_completion([]):
+                pass
@@ -0,0 +1,143 @@
+import importlib.util
+from pathlib import Path
+
+import httpx
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "load_test.py"
+_spec = importlib.util.spec_from_file_location("load_test", SCRIPT)
+load_test = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(load_test)
+
+
+def level(concurrency: int, flows: int) -> "load_test.LevelResult":
+    return load_test.LevelResult(concurrency=concurrency, duration=1.0, flows_completed=flows)
+
+
+class TestPercentile:
+    def test_nearest_rank(self):
+        values = [float(i) for i in range(1, 101)]
+        assert load_test.percentile(values, 0.50) == 50.0
+        assert load_test.percentile(values, 0.95) == 95.0
+        assert load_test.percentile(values, 0.99) == 99.0
+
+    def test_empty_and_single(self):
+        assert load_test.percentile([], 0.95) == 0.0
+        assert load_test.percentile([3.0], 0.01) == 3.0
+
+
+class TestFindSaturation:
+    def test_returns_level_before_gain_stops(self):
+        results = [level(1, 10), level(2, 19), level(4, 30), level(8, 31)]
+        assert load_test.find_saturation(results, 0.1).concurrency == 4
+
+    def test_none_when_a_level_failed(self):
+        failing = level(4, 0)
+        failing.errors = {"create_session": 500}
+        results = [level(1, 10), level(2, 19), failing, level(8, 20)]
+        assert load_test.find_saturation(results, 0.1) is None
+
+    def test_none_when_mostly_errors(self):
+        noisy = level(4, 5)
+        noisy.latencies = {"create_session": [0.1] * 5}
+        noisy.errors = {"feedback": 6}
+        assert not noisy.healthy
+        assert load_test.find_saturation([level(1, 10), noisy, level(8, 10)], 0.1) is None
+
+    def test_none_while_still_scaling(self):
+        results = [level(1, 10), level(2, 20), level(4, 40)]
+        assert load_test.find_saturation(results, 0.1) is None
+
+
+class TestLoadFlows:
+    def test_splits_flows_on_create_session(self, tmp_path):
+        path = tmp_path / "traffic.jsonl"
+        path.write_text(
+            '{"endpoint": "create_session", "body": {"user_goal": "a"}}\n'
+            '{"endpoint": "run_optimize", "body": {}}\n'
+            "\n"
+            '{"endpoint": "create_session", "body": {"user_goal": "b"}}\n'
+        )
+        flows = load_test.load_flows(path)
+        assert [[s.endpoint for s in flow] for flow in flows] == [
+            ["create_session", "run_optimize"],
+            ["create_session"],
+        ]
+
+    def test_unknown_endpoint(self, tmp_path):
+        path = tmp_path / "traffic.jsonl"
+        path.write_text('{"endpoint": "delete_session", "body": {}}\n')
+        with pytest.raises(ValueError, match="1: unknown endpoint 'delete_session'"):
+            load_test.load_flows(path)
+
+    def test_invalid_body(self, tmp_path):
+        path = tmp_path / "traffic.jsonl"
+        path.write_text(
+            '{"endpoint": "create_session", "body": {"user_goal": "a"}}\n'
+            '{"endpoint": "run_optimize", "body": {"max_iterations": 0}}\n'
+        )
+        with pytest.raises(ValueError, match="2: invalid run_optimize body"):
+            load_test.load_flows(path)
+
+    def test_step_before_create_session(self, tmp_path):
+        path = tmp_path / "traffic.jsonl"
+        path.write_text('{"endpoint": "feedback", "body": {"feedback_text": "x"}}\n')
+        with pytest.raises(ValueError, match="feedback before any create_session"):
+            load_test.load_flows(path)
+
+
+async def test_run_level_against_stand_in():
+    target = load_test.StandInTarget(latency_scale=0.001, workers=4, seed=1)
+    result = await load_test.run_level(target, 4, 0.3, None, None, seed=1)
+    await target.aclose()
+    assert result.flows_completed > 0
+    assert sum(result.errors.values()) == 0
+    assert all(result.latencies[name] for name in load_test.ENDPOINTS)
+    assert result.cpu_percent is None
+    assert result.summary()["throughput"] > 0
+
+
+class TestStandInProviderServer:
+    async def test_serves_provider_shapes_and_counts(self):
+        server = load_test.StandInProviderServer(latency_scale=0.001, seed=1)
+        url = await server.start()
+        try:
+            async with httpx.AsyncClient(base_url=url) as client:
+                chat = await client.post("/chat/completions", json={"model": "m"})
+                content = chat.json()["choices"][0]["message"]["content"]
+                assert '"score": 70' in content
+
+                stream = await client.post("/chat/completions", json={"stream": True})
+                assert stream.text.rstrip().endswith("data: [DONE]")
+
+                image = await client.post("/images/generations", json={"prompt": "p"})
+                assert image.json()["data"][0]["b64_json"] == load_test.STAND_IN_PNG_B64
+
+                gemini = await client.post("/models/nano:generateContent", json={})
+                assert gemini.json()["candidates"][0]["content"]["parts"][0]["inlineData"]
+
+                assert (await client.post("/v1/unknown", json={})).status_code == 404
+                stats = await client.get(load_test.STAND_IN_STATS_PATH)
+            assert stats.json() == {"requests": 4}
+        finally:
+            await server.aclose()
+
+    async def test_check_stand_in_used(self):
+        server = load_test.StandInProviderServer(latency_scale=0.001, seed=1)
+        url = await server.start()
+        flow = [load_test.Step(endpoint="create_session", body={})]
+
+        class CallsProviders:
+            async def send(self, step, state):
+                async with httpx.AsyncClient(base_url=url) as client:
+                    await client.post("/chat/completions", json={})
+
+        class SkipsProviders:
+            async def send(self, step, state):
+                pass
+
+        try:
+            assert await load_test.check_stand_in_used(CallsProviders(), url, flow)
+            assert not await load_test.check_stand_in_used(SkipsProviders(), url, flow)
+        finally:
+            await server.aclose()
@@ -0,0 +1,124 @@
+import pytest
+
+from app.models.domain_models import ProviderCapabilities
+from app.services import preflight_service
+from app.utils.flex_utils import parse_flex_blocks, strip_flex_markers
+
+PROMPT = """## FLEX_BEGIN:subject
+A lone lighthouse keeper on a storm-battered cliff
+## FLEX_END:subject
+
+## FLEX_BEGIN:lighting
+dramatic side lighting, heavy storm clouds, deep shadow pools
+## FLEX_END:lighting
+
+## FLEX_BEGIN:camera
+35mm lens, low angle, slight tilt, shallow depth of field
+## FLEX_END:camera"""
+
+
+@pytest.fixture
+def caps() -> ProviderCapabilities:
+    return ProviderCapabilities(
+        provider_name="openai",
+        supported_sizes=["1024x1024", "1792x1024"],
+        default_size="1024x1024",
+        supported_qualities=["standard", "hd"],
+        supported_styles=["vivid", "natural"],
+        default_params={"n": 1},
+    )
+
+
+class TestImageParams:
+    def test_defaults_applied(self, caps):
+        result = preflight_service.run(PROMPT, caps)
+        assert result.ok
+        assert result.image_params == {"n": 1, "size": "1024x1024"}
+
+    def test_unsupported_size(self, caps):
+        result = preflight_service.run(PROMPT, caps, image_params={"size": "512x512"})
+        assert not result.ok
+        assert result.errors[0].code == "unsupported_size"
+        assert result.errors[0].field == "image_params.size"
+        assert "1792x1024" in result.errors[0].message
+
+    def test_quality_not_offered_by_provider(self, caps):
+        caps.supported_qualities = None
+        result = preflight_service.run(PROMPT, caps, image_params={"quality": "hd"})
+        assert [e.code for e in result.errors] == ["unsupported_quality"]
+
+    def test_unknown_param_and_wrong_type(self, caps):
+        result = preflight_service.run(
+            PROMPT, caps, image_params={"seed": 42, "n": "two", "style": "natural"}
+        )
+        codes = {e.field: e.code for e in result.errors}
+        assert codes == {
+            "image_params.seed": "unknown_param",
+            "image_params.n": "invalid_param_type",
+        }
+
+    def test_none_default_accepts_any_value(self, caps):
+        caps.default_params = {"n": 1, "seed": None}
+        result = preflight_service.run(PROMPT, caps, image_params={"seed": 42})
+        assert result.ok
+        assert result.image_params["seed"] == 42
+
+
+class TestPrompt:
+    def test_negative_prompt_dropped_when_unsupported(self, caps):
+        result = preflight_service.run(PROMPT, caps, negative_prompt="blurry")
+        assert result.ok
+        assert result.negative_prompt is None
+        assert result.warnings[0].code == "negative_prompt_dropped"
+
+    def test_negative_prompt_kept_when_supported(self, caps):
+        caps.supports_negative_prompt = True
+        result = preflight_service.run(PROMPT, caps, negative_prompt="blurry")
+        assert result.negative_prompt == "blurry"
+        assert result.warnings == []
+
+    def test_empty_prompt(self, caps):
+        result = preflight_service.run("## FLEX_BEGIN:subject\n\n## FLEX_END:subject", caps)
+        assert result.errors[0].code == "empty_prompt"
+
+    def test_shortens_low_priority_blocks_first(self, caps):
+        full = len(strip_flex_markers(PROMPT))
+        caps.max_prompt_chars = full - 10
+        result = preflight_service.run(PROMPT, caps)
+        assert result.ok
+        assert len(strip_flex_markers(result.prompt_text)) <= full - 10
+        blocks = parse_flex_blocks(result.prompt_text)
+        assert blocks["subject"] == "A lone lighthouse keeper on a storm-battered cliff"
+        assert blocks["lighting"] == "dramatic side lighting, heavy storm clouds, deep shadow pools"
+        assert blocks["camera"] == "35mm lens, low angle, slight tilt"
+        assert result.warnings[0].code == "prompt_shortened"
+
+    def test_drops_blocks_but_keeps_subject(self, caps):
+        caps.max_prompt_chars = 60
+        result = preflight_service.run(PROMPT, caps)
+        assert result.ok
+        assert list(parse_flex_blocks(result.prompt_text)) == ["subject"]
+
+    def test_prompt_too_long_when_subject_cannot_fit(self, caps):
+        caps.max_prompt_chars = 20
+        result = preflight_service.run(PROMPT, caps)
+        assert result.errors[0].code == "prompt_too_long"
+
+    def test_block_states_protect_frozen_blocks(self, caps):
+        caps.max_prompt_chars = 60
+        states = {"subject": "REVISE", "lighting": "FLEX", "camera": "FROZEN"}
+        result = preflight_service.run(PROMPT, caps, block_states=states)
+        blocks = parse_flex_blocks(result.prompt_text)
+        assert blocks["camera"] == "35mm lens, low angle, slight tilt, shallow depth of field"
+        assert "lighting" not in blocks
+        assert blocks["subject"] == "A lone lighthouse keeper on a storm-battered cliff"
+        assert result.errors[0].code == "prompt_too_long"
+
+    def test_block_states_trim_flex_before_revise(self, caps):
+        full = len(strip_flex_markers(PROMPT))
+        caps.max_prompt_chars = full - 10
+        states = {"subject": "FROZEN", "lighting": "FLEX", "camera": "REVISE"}
+        result = preflight_service.run(PROMPT, caps, block_states=states)
+        blocks = parse_flex_blocks(result.prompt_text)
+        assert blocks["lighting"] == "dramatic side lighting, heavy storm clouds"
+        assert blocks["camera"] == "35mm lens, low angle, slight tilt, shallow depth of field"